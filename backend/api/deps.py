@@ -1,4 +1,12 @@
-"""Dependency injection for FastAPI."""
+"""Dependency injection for FastAPI.
+
+Infrastructure singletons are built once by the cached ``create_*``
+factories, stored on ``app.state`` in the application lifespan (see
+``main.lifespan``), and read back by the request-time providers.
+"""
+from functools import lru_cache
+from fastapi import Request
+from starlette.datastructures import State
 from core.ports import (
     RickAndMortyClient,
     CharacterRepository,
@@ -13,121 +21,153 @@ from core.services import (
     CharacterService,
     GenerationService,
     SearchService,
+    EpisodeService,
 )
 from infrastructure.api.graphql_client import RickAndMortyGraphQLClient
-from infrastructure.repositories.character_repository import (
-    SQLiteCharacterRepository,
-)
-from infrastructure.repositories.note_repository import (
-    SQLiteNoteRepository,
-)
+from infrastructure.repositories.character_repository import SQLiteCharacterRepository
+from infrastructure.repositories.note_repository import SQLiteNoteRepository
 from infrastructure.repositories.generated_content_repository import (
     SQLiteGeneratedContentRepository,
 )
 from infrastructure.llm.openai_provider import OpenAIProvider
 from infrastructure.evaluation.evaluator import HeuristicEvaluator
 from infrastructure.vector_store.sqlite_vector_store import SQLiteVectorStore
+from shared.config import settings
+from shared.logging import logger
+
+
+# Infrastructure factories (cached: one instance per process)
+@lru_cache(maxsize=1)
+def create_api_client() -> RickAndMortyClient:
+    """Create the Rick & Morty API client (GraphQL)."""
+    return RickAndMortyGraphQLClient()
+
+
+@lru_cache(maxsize=1)
+def create_character_repository() -> CharacterRepository:
+    """Create the character repository (legacy)."""
+    return SQLiteCharacterRepository()
+
+
+@lru_cache(maxsize=1)
+def create_note_repository() -> NoteRepository:
+    """Create the unified note repository."""
+    return SQLiteNoteRepository()
+
+
+@lru_cache(maxsize=1)
+def create_content_repository() -> GeneratedContentRepository:
+    """Create the generated content repository."""
+    return SQLiteGeneratedContentRepository()
+
+
+@lru_cache(maxsize=1)
+def create_llm_provider() -> LLMProvider:
+    """Create the LLM provider."""
+    return OpenAIProvider()
+
+
+@lru_cache(maxsize=1)
+def create_evaluator() -> EvaluationProvider:
+    """Create the evaluation provider."""
+    return HeuristicEvaluator()
 
 
-# Infrastructure instances
-_api_client: RickAndMortyClient | None = None
-_character_repo: CharacterRepository | None = None
-_note_repo: NoteRepository | None = None
-_content_repo: GeneratedContentRepository | None = None
-_llm_provider: LLMProvider | None = None
-_evaluator: EvaluationProvider | None = None
-_vector_store: VectorStore | None = None
+@lru_cache(maxsize=1)
+def create_vector_store() -> VectorStore:
+    """Create the vector store (FAISS-indexed when available)."""
+    if settings.vector_store_backend == "faiss":
+        try:
+            from infrastructure.vector_store.faiss_vector_store import FaissVectorStore
+            return FaissVectorStore()
+        except ImportError:
+            logger.warning("faiss is not installed; falling back to SQLite vector search")
+    return SQLiteVectorStore()
 
 
-def get_api_client() -> RickAndMortyClient:
+# Request-time providers
+
+
+async def get_api_client(request: Request) -> RickAndMortyClient:
     """Get Rick & Morty API client (GraphQL)."""
-    global _api_client
-    if _api_client is None:
-        _api_client = RickAndMortyGraphQLClient()
-    return _api_client
+    return request.app.state.api_client
 
 
-def get_character_repository() -> CharacterRepository:
+async def get_character_repository(request: Request) -> CharacterRepository:
     """Get character repository (legacy)."""
-    global _character_repo
-    if _character_repo is None:
-        _character_repo = SQLiteCharacterRepository()
-    return _character_repo
+    return request.app.state.character_repo
 
 
-def get_note_repository() -> NoteRepository:
+async def get_note_repository(request: Request) -> NoteRepository:
     """Get unified note repository."""
-    global _note_repo
-    if _note_repo is None:
-        _note_repo = SQLiteNoteRepository()
-    return _note_repo
+    return request.app.state.note_repo
 
 
-def get_content_repository() -> GeneratedContentRepository:
+async def get_content_repository(request: Request) -> GeneratedContentRepository:
     """Get generated content repository."""
-    global _content_repo
-    if _content_repo is None:
-        _content_repo = SQLiteGeneratedContentRepository()
-    return _content_repo
+    return request.app.state.content_repo
 
 
-def get_llm_provider() -> LLMProvider:
+async def get_llm_provider(request: Request) -> LLMProvider:
     """Get LLM provider."""
-    global _llm_provider
-    if _llm_provider is None:
-        _llm_provider = OpenAIProvider()
-    return _llm_provider
+    return request.app.state.llm_provider
 
 
-def get_evaluator() -> EvaluationProvider:
+async def get_evaluator(request: Request) -> EvaluationProvider:
     """Get evaluation provider."""
-    global _evaluator
-    if _evaluator is None:
-        _evaluator = HeuristicEvaluator()
-    return _evaluator
+    return request.app.state.evaluator
 
 
-def get_vector_store() -> VectorStore:
+async def get_vector_store(request: Request) -> VectorStore:
     """Get vector store."""
-    global _vector_store
-    if _vector_store is None:
-        _vector_store = SQLiteVectorStore()
-    return _vector_store
+    return request.app.state.vector_store
+
+
+def build_generation_service(state: State) -> GenerationService:
+    """Build a generation service from lifespan state."""
+    return GenerationService(
+        state.api_client,
+        state.llm_provider,
+        state.evaluator,
+        state.content_repo,
+        state.note_repo,
+    )
+
+
+def build_services(state: State) -> None:
+    """Build the stateless services once and store them on lifespan state."""
+    state.location_service = LocationService(state.api_client, state.note_repo)
+    state.character_service = CharacterService(
+        state.api_client,
+        state.character_repo,
+        state.note_repo,
+    )
+    state.generation_service = build_generation_service(state)
+    state.search_service = SearchService(state.llm_provider)
+    state.episode_service = EpisodeService(state.api_client, state.note_repo)
 
 
 # Service instances
-def get_location_service() -> LocationService:
+async def get_location_service(request: Request) -> LocationService:
     """Get location service."""
-    return LocationService(get_api_client(), get_note_repository())
+    return request.app.state.location_service
 
 
-def get_character_service() -> CharacterService:
+async def get_character_service(request: Request) -> CharacterService:
     """Get character service."""
-    return CharacterService(
-        get_api_client(),
-        get_character_repository(),
-        get_note_repository(),
-    )
+    return request.app.state.character_service
 
 
-def get_generation_service() -> GenerationService:
+async def get_generation_service(request: Request) -> GenerationService:
     """Get generation service."""
-    return GenerationService(
-        get_api_client(),
-        get_llm_provider(),
-        get_evaluator(),
-        get_content_repository(),
-        get_note_repository(),
-    )
+    return request.app.state.generation_service
 
 
-def get_search_service() -> SearchService:
+async def get_search_service(request: Request) -> SearchService:
     """Get search service."""
-    return SearchService(get_llm_provider())
+    return request.app.state.search_service
 
 
-def get_episode_service() -> "EpisodeService":
+async def get_episode_service(request: Request) -> EpisodeService:
     """Get episode service."""
-    from core.services.episode_service import EpisodeService
-    return EpisodeService(get_api_client(), get_note_repository())
-
+    return request.app.state.episode_service
@@ -1,9 +1,15 @@
 """Data Transfer Objects for API."""
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from typing import Any
+from core.models import Note
 
 
-class CharacterResponse(BaseModel):
+class FrozenResponse(BaseModel):
+    """Base for response DTOs: built once per request and never mutated."""
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+
+class CharacterResponse(FrozenResponse):
     """Character API response."""
     id: int
     name: str
@@ -20,16 +26,27 @@ class CharacterResponse(BaseModel):
     created: str = ""
 
 
-class NoteResponse(BaseModel):
+class NoteResponse(FrozenResponse):
     """Note API response."""
     id: int
     subject_type: str  # 'character', 'location', or 'episode'
     subject_id: int
     note_text: str
     created_at: str
-
-
-class LocationResponse(BaseModel):
+    
+    @classmethod
+    def from_note(cls, note: Note) -> "NoteResponse":
+        """Build from a domain note, using its preformatted created_at_iso."""
+        return cls(
+            id=note.id,
+            subject_type=note.subject_type,
+            subject_id=note.subject_id,
+            note_text=note.note_text,
+            created_at=note.created_at_iso,
+        )
+
+
+class LocationResponse(FrozenResponse):
     """Location API response."""
     id: int
     name: str
@@ -38,7 +55,7 @@ class LocationResponse(BaseModel):
     residents: list[CharacterResponse]
 
 
-class ResidentResponse(BaseModel):
+class ResidentResponse(FrozenResponse):
     """Resident (character) summary for location."""
     id: int
     name: str
@@ -47,7 +64,7 @@ class ResidentResponse(BaseModel):
     image: str
 
 
-class LocationSummaryResponse(BaseModel):
+class LocationSummaryResponse(FrozenResponse):
     """Location with simplified resident list."""
     id: int
     name: str
@@ -62,7 +79,7 @@ class AddNoteRequest(BaseModel):
     note_text: str
 
 
-class GeneratedContentResponse(BaseModel):
+class GeneratedContentResponse(FrozenResponse):
     """Generated content with evaluation."""
     id: int
     subject_id: int
@@ -75,13 +92,13 @@ class GeneratedContentResponse(BaseModel):
     created_at: str
 
 
-class SearchResultResponse(BaseModel):
+class SearchResultResponse(FrozenResponse):
     """Search result response (legacy - character only)."""
     character: CharacterResponse
     similarity_score: float
 
 
-class UnifiedSearchResultResponse(BaseModel):
+class UnifiedSearchResultResponse(FrozenResponse):
     """Unified search result response (characters, locations, episodes)."""
     entity_type: str  # "character" | "location" | "episode"
     entity_id: str
@@ -90,7 +107,7 @@ class UnifiedSearchResultResponse(BaseModel):
     similarity: float
 
 
-class EpisodeSummaryResponse(BaseModel):
+class EpisodeSummaryResponse(FrozenResponse):
     """Episode summary for list view."""
     id: int
     name: str
@@ -100,7 +117,7 @@ class EpisodeSummaryResponse(BaseModel):
     characters: list[CharacterResponse] | None = None  # Optional: include characters if available
 
 
-class EpisodeResponse(BaseModel):
+class EpisodeResponse(FrozenResponse):
     """Episode API response with characters."""
     id: int
     name: str
@@ -109,13 +126,19 @@ class EpisodeResponse(BaseModel):
     characters: list[CharacterResponse]
 
 
+# Batch validators for lists built straight from domain objects
+CHARACTER_LIST_ADAPTER = TypeAdapter(list[CharacterResponse])
+NOTE_LIST_ADAPTER = TypeAdapter(list[NoteResponse])
+SEARCH_RESULT_LIST_ADAPTER = TypeAdapter(list[UnifiedSearchResultResponse])
+
+
 class DialogueRequest(BaseModel):
     """Request to generate dialogue."""
     character_id2: int
     topic: str = ""
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(FrozenResponse):
     """Error response."""
     detail: str
 
@@ -126,7 +149,7 @@ class GenerateSummaryRequest(BaseModel):
     entityId: str
 
 
-class GenerateSummaryResponse(BaseModel):
+class GenerateSummaryResponse(FrozenResponse):
     """Generate summary response."""
     entityType: str
     entityId: str
@@ -145,7 +168,7 @@ class RegenerateNoteRequest(BaseModel):
     entity_id: int
 
 
-class RegenerateNoteResponse(BaseModel):
+class RegenerateNoteResponse(FrozenResponse):
     """Response for regenerated note text."""
     improved_text: str
 
@@ -0,0 +1,18 @@
+"""Pre-serialized JSON responses.
+
+Routes return these instead of declaring response_model, so FastAPI does not
+re-validate DTOs the route has just built; the schema is documented through
+`responses={200: {"model": ...}}` instead.
+"""
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def json_response(body: bytes, headers: dict[str, str] | None = None) -> Response:
+    """Wrap pre-serialized JSON bytes in a response."""
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def model_response(model: BaseModel) -> Response:
+    """Serialize a response DTO in one pydantic-core call."""
+    return json_response(model.model_dump_json())
@@ -1,14 +1,24 @@
 """Episode routes."""
-from fastapi import APIRouter, Depends, HTTPException, Query
-from api.deps import get_episode_service
-from api.dtos import EpisodeResponse, EpisodeSummaryResponse, CharacterResponse, NoteResponse, AddNoteRequest
-from core.services import EpisodeService
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse
+from api.deps import get_episode_service, get_generation_service
+from api.dtos import (
+    EpisodeResponse,
+    EpisodeSummaryResponse,
+    NoteResponse,
+    AddNoteRequest,
+    CHARACTER_LIST_ADAPTER,
+    NOTE_LIST_ADAPTER,
+)
+from api.responses import json_response, model_response
+from core.services import EpisodeService, GenerationService
+from shared.logging import logger
 
 
 router = APIRouter(prefix="/episodes", tags=["episodes"])
 
 
-@router.get("", response_model=list[EpisodeSummaryResponse])
+@router.get("", responses={200: {"model": list[EpisodeSummaryResponse]}})
 async def get_episodes(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
@@ -17,22 +27,22 @@ async def get_episodes(
     """Get paginated episodes."""
     try:
         episodes, total = await episode_service.get_episodes_paginated(page, limit)
-        return [
-            EpisodeSummaryResponse(
-                id=ep.id,
-                name=ep.name,
-                air_date=ep.air_date,
-                episode=ep.episode,
-                character_count=getattr(ep, '_character_count', len(ep.characters) if isinstance(ep.characters, list) else (len(ep.characters_data) if ep.characters_data else 0)),
-                characters=None,  # Don't include characters in list - only when fetching single episode
-            )
+        return ORJSONResponse(content=[
+            {
+                "id": ep.id,
+                "name": ep.name,
+                "air_date": ep.air_date,
+                "episode": ep.episode,
+                "character_count": ep.character_count,
+                "characters": None,  # Don't include characters in list - only when fetching single episode
+            }
             for ep in episodes
-        ]
+        ])
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/{episode_id}", response_model=EpisodeResponse)
+@router.get("/{episode_id}", responses={200: {"model": EpisodeResponse}})
 async def get_episode(
     episode_id: int,
     episode_service: EpisodeService = Depends(get_episode_service),
@@ -40,50 +50,31 @@ async def get_episode(
     """Get a specific episode."""
     try:
         episode, characters = await episode_service.get_episode_with_characters(episode_id)
-        from api.dtos import CharacterResponse
-        from shared.logging import logger
         
         try:
-            character_responses = [
-                CharacterResponse(
-                    id=char.id,
-                    name=char.name,
-                    status=char.status,
-                    species=char.species,
-                    type=char.type,
-                    gender=char.gender,
-                    origin=char.origin,
-                    location=char.location,
-                    image=char.image,
-                    episode=char.episode,
-                    url=getattr(char, 'url', ''),
-                    created=getattr(char, 'created', ''),
-                )
-                for char in characters
-            ]
+            character_responses = CHARACTER_LIST_ADAPTER.validate_python(
+                characters, from_attributes=True
+            )
         except Exception as e:
             logger.error(f"Error converting characters to response: {e}")
             character_responses = []
         
-        return EpisodeResponse(
+        return model_response(EpisodeResponse(
             id=episode.id,
             name=episode.name,
             air_date=episode.air_date,
             episode=episode.episode,
             characters=character_responses,
-        )
+        ))
     except ValueError as e:
-        from shared.logging import logger
-        logger.error(f"Episode {episode_id} not found: {e}")
+        logger.error("Episode %s not found: %s", episode_id, e)
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        from shared.logging import logger
-        import traceback
-        logger.error(f"Error fetching episode {episode_id}: {str(e)}\n{traceback.format_exc()}")
+        logger.exception("Error fetching episode %s", episode_id)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.get("/{episode_id}/notes", response_model=list[NoteResponse])
+@router.get("/{episode_id}/notes", responses={200: {"model": list[NoteResponse]}})
 async def get_episode_notes(
     episode_id: int,
     episode_service: EpisodeService = Depends(get_episode_service),
@@ -91,49 +82,36 @@ async def get_episode_notes(
     """Get notes for an episode."""
     try:
         _, notes = await episode_service.get_episode_with_notes(episode_id)
-        return [
-            NoteResponse(
-                id=note.id,
-                subject_type=note.subject_type,
-                subject_id=note.subject_id,
-                note_text=note.note_text,
-                created_at=note.created_at.isoformat(),
-            )
-            for note in notes
-        ]
     except Exception as e:
         raise HTTPException(status_code=404, detail=str(e))
+    return json_response(NOTE_LIST_ADAPTER.dump_json([NoteResponse.from_note(note) for note in notes]))
 
 
-@router.post("/{episode_id}/notes", response_model=NoteResponse)
+@router.post("/{episode_id}/notes", responses={200: {"model": NoteResponse}})
 async def add_episode_note(
     episode_id: int,
     request: AddNoteRequest,
+    background_tasks: BackgroundTasks,
     episode_service: EpisodeService = Depends(get_episode_service),
+    generation_service: GenerationService = Depends(get_generation_service),
 ):
     """Add a note to an episode."""
     try:
         note = await episode_service.add_note(episode_id, request.note_text)
         
-        # Rebuild search index after adding note
-        from api.deps import get_generation_service
-        generation_service = get_generation_service()
-        await generation_service.rebuild_search_index("episode", str(episode_id))
-        
-        return NoteResponse(
-            id=note.id,
-            subject_type=note.subject_type,
-            subject_id=note.subject_id,
-            note_text=note.note_text,
-            created_at=note.created_at.isoformat(),
+        # Rebuild search index after the response is sent
+        background_tasks.add_task(
+            generation_service.rebuild_search_index, "episode", str(episode_id)
         )
+        
+        return model_response(NoteResponse.from_note(note))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.put("/notes/{note_id}", response_model=NoteResponse)
+@router.put("/notes/{note_id}", responses={200: {"model": NoteResponse}})
 async def update_episode_note(
     note_id: int,
     request: AddNoteRequest,
@@ -142,13 +120,7 @@ async def update_episode_note(
     """Update a note."""
     try:
         note = await episode_service.update_note(note_id, request.note_text)
-        return NoteResponse(
-            id=note.id,
-            subject_type=note.subject_type,
-            subject_id=note.subject_id,
-            note_text=note.note_text,
-            created_at=note.created_at.isoformat(),
-        )
+        return model_response(NoteResponse.from_note(note))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -1,101 +1,84 @@
 """Generation routes."""
-from fastapi import APIRouter, Depends, HTTPException
+import inspect
+from fastapi import APIRouter, Depends, HTTPException, Response
 from api.deps import get_generation_service
 from api.dtos import (
     GeneratedContentResponse,
     DialogueRequest,
-    GenerateSummaryRequest,
-    GenerateSummaryResponse,
     RegenerateNoteRequest,
     RegenerateNoteResponse,
 )
+from api.responses import model_response
+from core.models import GeneratedContent
 from core.services import GenerationService
 
 
 router = APIRouter(prefix="/generate", tags=["generation"])
 
 
-@router.post(
-    "/location-summary/{location_id}",
-    response_model=GeneratedContentResponse,
-)
-async def generate_location_summary(
-    location_id: int,
-    generation_service: GenerationService = Depends(get_generation_service),
-):
-    """Generate a location summary with AI evaluation."""
-    try:
-        content = await generation_service.generate_location_summary(location_id)
-        return GeneratedContentResponse(
-            id=content.id,
-            subject_id=content.subject_id,
-            prompt_type=content.prompt_type,
-            output_text=content.output_text,
-            factual_score=content.factual_score,
-            completeness_score=content.completeness_score,
-            creativity_score=content.creativity_score,
-            relevance_score=content.relevance_score,
-            created_at=content.created_at.isoformat(),
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+def _build_response(content: GeneratedContent) -> Response:
+    """Build the API response for a piece of generated content."""
+    return model_response(GeneratedContentResponse(
+        id=content.id,
+        subject_id=content.subject_id,
+        prompt_type=content.prompt_type,
+        output_text=content.output_text,
+        factual_score=content.factual_score,
+        completeness_score=content.completeness_score,
+        creativity_score=content.creativity_score,
+        relevance_score=content.relevance_score,
+        created_at=content.created_at.isoformat(),
+    ))
 
 
-@router.post(
-    "/episode-summary/{episode_id}",
-    response_model=GeneratedContentResponse,
-)
-async def generate_episode_summary(
-    episode_id: int,
-    generation_service: GenerationService = Depends(get_generation_service),
-):
-    """Generate an episode summary with AI evaluation."""
-    try:
-        content = await generation_service.generate_episode_summary(episode_id)
-        return GeneratedContentResponse(
-            id=content.id,
-            subject_id=content.subject_id,
-            prompt_type=content.prompt_type,
-            output_text=content.output_text,
-            factual_score=content.factual_score,
-            completeness_score=content.completeness_score,
-            creativity_score=content.creativity_score,
-            relevance_score=content.relevance_score,
-            created_at=content.created_at.isoformat(),
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+def _make_summary_endpoint(entity_type: str, doc: str):
+    """Build a summary endpoint that delegates to generate_<entity_type>_summary.
+    
+    The handler's signature names the path parameter `<entity_type>_id`, so each
+    route keeps its own parameter name and operation ID.
+    """
+    service_method_name = f"generate_{entity_type}_summary"
+    param_name = f"{entity_type}_id"
+    
+    async def handler(generation_service: GenerationService, **path_params: int):
+        try:
+            content = await getattr(generation_service, service_method_name)(
+                path_params[param_name]
+            )
+            return _build_response(content)
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+    
+    handler.__signature__ = inspect.Signature([
+        inspect.Parameter(param_name, inspect.Parameter.KEYWORD_ONLY, annotation=int),
+        inspect.Parameter(
+            "generation_service",
+            inspect.Parameter.KEYWORD_ONLY,
+            default=Depends(get_generation_service),
+            annotation=GenerationService,
+        ),
+    ])
+    handler.__doc__ = doc
+    return handler
 
 
-@router.post(
-    "/character-summary/{character_id}",
-    response_model=GeneratedContentResponse,
-)
-async def generate_character_summary(
-    character_id: int,
-    generation_service: GenerationService = Depends(get_generation_service),
+for _entity_type, _doc in (
+    ("location", "Generate a location summary with AI evaluation."),
+    ("episode", "Generate an episode summary with AI evaluation."),
+    ("character", "Generate a character summary with AI evaluation."),
 ):
-    """Generate a character summary with AI evaluation."""
-    try:
-        content = await generation_service.generate_character_summary(character_id)
-        return GeneratedContentResponse(
-            id=content.id,
-            subject_id=content.subject_id,
-            prompt_type=content.prompt_type,
-            output_text=content.output_text,
-            factual_score=content.factual_score,
-            completeness_score=content.completeness_score,
-            creativity_score=content.creativity_score,
-            relevance_score=content.relevance_score,
-            created_at=content.created_at.isoformat(),
-        )
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    router.add_api_route(
+        f"/{_entity_type}-summary/{{{_entity_type}_id}}",
+        _make_summary_endpoint(_entity_type, _doc),
+        methods=["POST"],
+        responses={200: {"model": GeneratedContentResponse}},
+        name=f"generate_{_entity_type}_summary",
+    )
 
 
 @router.post(
     "/dialogue/{character_id1}",
-    response_model=GeneratedContentResponse,
+    responses={200: {"model": GeneratedContentResponse}},
 )
 async def generate_dialogue(
     character_id1: int,
@@ -107,24 +90,14 @@ async def generate_dialogue(
         content = await generation_service.generate_character_dialogue(
             character_id1, request.character_id2, request.topic
         )
-        return GeneratedContentResponse(
-            id=content.id,
-            subject_id=content.subject_id,
-            prompt_type=content.prompt_type,
-            output_text=content.output_text,
-            factual_score=content.factual_score,
-            completeness_score=content.completeness_score,
-            creativity_score=content.creativity_score,
-            relevance_score=content.relevance_score,
-            created_at=content.created_at.isoformat(),
-        )
+        return _build_response(content)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.post(
     "/regenerate-note",
-    response_model=RegenerateNoteResponse,
+    responses={200: {"model": RegenerateNoteResponse}},
 )
 async def regenerate_note(
     request: RegenerateNoteRequest,
@@ -137,7 +110,7 @@ async def regenerate_note(
             request.entity_type,
             request.entity_id,
         )
-        return RegenerateNoteResponse(improved_text=improved_text)
+        return model_response(RegenerateNoteResponse(improved_text=improved_text))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1,46 +1,62 @@
 """Location routes."""
-from fastapi import APIRouter, Depends, HTTPException, Query
-from api.deps import get_location_service
+import orjson
+from cachetools import TTLCache
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
+from api.deps import get_location_service, get_generation_service
 from api.dtos import (
     LocationSummaryResponse,
     LocationResponse,
-    ResidentResponse,
-    CharacterResponse,
     NoteResponse,
     AddNoteRequest,
+    CHARACTER_LIST_ADAPTER,
+    NOTE_LIST_ADAPTER,
 )
-from core.services import LocationService
-from typing import Optional
+from api.responses import json_response, model_response
+from core.services import LocationService, GenerationService
+from shared.logging import logger
 
 
 router = APIRouter(prefix="/locations", tags=["locations"])
 
+# Serialized location pages. They only change upstream, so a short TTL suffices.
+# Only complete bodies are cached here or sent with the public Cache-Control header.
+_CACHE_TTL_SECONDS = 60
+_locations_page_cache: TTLCache = TTLCache(maxsize=256, ttl=_CACHE_TTL_SECONDS)
+_PAGE_CACHE_HEADERS = {"Cache-Control": f"public, max-age={_CACHE_TTL_SECONDS}"}
 
-@router.get("", response_model=list[LocationSummaryResponse])
+
+@router.get("", responses={200: {"model": list[LocationSummaryResponse]}})
 async def get_locations(
     page: int = Query(1, ge=1, description="Page number"),
     limit: int = Query(20, ge=1, le=100, description="Items per page"),
     location_service: LocationService = Depends(get_location_service),
 ):
     """Get paginated locations."""
+    cached = _locations_page_cache.get((page, limit))
+    if cached is not None:
+        return json_response(cached, _PAGE_CACHE_HEADERS)
+    
     try:
         locations, total = await location_service.get_locations_paginated(page, limit)
-        return [
-            LocationSummaryResponse(
-                id=loc.id,
-                name=loc.name,
-                type=loc.type,
-                dimension=loc.dimension,
-                resident_count=getattr(loc, '_resident_count', len(loc.residents) if loc.residents else 0),
-                residents=[],  # Don't include residents in list - only when fetching single location
-            )
+        body = orjson.dumps([
+            {
+                "id": loc.id,
+                "name": loc.name,
+                "type": loc.type,
+                "dimension": loc.dimension,
+                "resident_count": loc.resident_count,
+                "residents": [],  # Don't include residents in list - only when fetching single location
+            }
             for loc in locations
-        ]
+        ])
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    
+    _locations_page_cache[(page, limit)] = body
+    return json_response(body, _PAGE_CACHE_HEADERS)
 
 
-@router.get("/{location_id}", response_model=LocationResponse)
+@router.get("/{location_id}", responses={200: {"model": LocationResponse}})
 async def get_location(
     location_id: int,
     location_service: LocationService = Depends(get_location_service),
@@ -48,49 +64,31 @@ async def get_location(
     """Get a specific location."""
     try:
         location = await location_service.get_location(location_id)
-        from shared.logging import logger
         
         try:
-            resident_responses = [
-                CharacterResponse(
-                    id=char.id,
-                    name=char.name,
-                    status=char.status,
-                    species=char.species,
-                    type=char.type,
-                    gender=char.gender,
-                    origin=char.origin,
-                    location=char.location,
-                    image=char.image,
-                    episode=char.episode,
-                    url=getattr(char, 'url', ''),
-                    created=getattr(char, 'created', ''),
-                )
-                for char in location.residents
-            ]
+            resident_responses = CHARACTER_LIST_ADAPTER.validate_python(
+                location.residents, from_attributes=True
+            )
         except Exception as e:
             logger.error(f"Error converting residents to response: {e}")
             resident_responses = []
         
-        return LocationResponse(
+        return model_response(LocationResponse(
             id=location.id,
             name=location.name,
             type=location.type,
             dimension=location.dimension,
             residents=resident_responses,
-        )
+        ))
     except ValueError as e:
-        from shared.logging import logger
-        logger.error(f"Location {location_id} not found: {e}")
+        logger.error("Location %s not found: %s", location_id, e)
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
-        from shared.logging import logger
-        import traceback
-        logger.error(f"Error fetching location {location_id}: {str(e)}\n{traceback.format_exc()}")
+        logger.exception("Error fetching location %s", location_id)
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.get("/{location_id}/notes", response_model=list[NoteResponse])
+@router.get("/{location_id}/notes", responses={200: {"model": list[NoteResponse]}})
 async def get_location_notes(
     location_id: int,
     location_service: LocationService = Depends(get_location_service),
@@ -98,49 +96,37 @@ async def get_location_notes(
     """Get notes for a location."""
     try:
         _, notes = await location_service.get_location_with_notes(location_id)
-        return [
-            NoteResponse(
-                id=note.id,
-                subject_type=note.subject_type,
-                subject_id=note.subject_id,
-                note_text=note.note_text,
-                created_at=note.created_at.isoformat(),
-            )
-            for note in notes
-        ]
     except Exception as e:
         raise HTTPException(status_code=404, detail=str(e))
+    
+    return json_response(NOTE_LIST_ADAPTER.dump_json([NoteResponse.from_note(note) for note in notes]))
 
 
-@router.post("/{location_id}/notes", response_model=NoteResponse)
+@router.post("/{location_id}/notes", responses={200: {"model": NoteResponse}})
 async def add_location_note(
     location_id: int,
     request: AddNoteRequest,
+    background_tasks: BackgroundTasks,
     location_service: LocationService = Depends(get_location_service),
+    generation_service: GenerationService = Depends(get_generation_service),
 ):
     """Add a note to a location."""
     try:
         note = await location_service.add_note(location_id, request.note_text)
         
-        # Rebuild search index after adding note
-        from api.deps import get_generation_service
-        generation_service = get_generation_service()
-        await generation_service.rebuild_search_index("location", str(location_id))
-        
-        return NoteResponse(
-            id=note.id,
-            subject_type=note.subject_type,
-            subject_id=note.subject_id,
-            note_text=note.note_text,
-            created_at=note.created_at.isoformat(),
+        # Refresh this location's search index entry after the response is sent
+        background_tasks.add_task(
+            generation_service.rebuild_search_index, "location", str(location_id)
         )
+        
+        return model_response(NoteResponse.from_note(note))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.put("/notes/{note_id}", response_model=NoteResponse)
+@router.put("/notes/{note_id}", responses={200: {"model": NoteResponse}})
 async def update_location_note(
     note_id: int,
     request: AddNoteRequest,
@@ -149,13 +135,7 @@ async def update_location_note(
     """Update a note."""
     try:
         note = await location_service.update_note(note_id, request.note_text)
-        return NoteResponse(
-            id=note.id,
-            subject_type=note.subject_type,
-            subject_id=note.subject_id,
-            note_text=note.note_text,
-            created_at=note.created_at.isoformat(),
-        )
+        return model_response(NoteResponse.from_note(note))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -1,14 +1,15 @@
 """Search routes."""
 from fastapi import APIRouter, Depends, HTTPException, Query
 from api.deps import get_search_service
-from api.dtos import UnifiedSearchResultResponse
+from api.dtos import UnifiedSearchResultResponse, SEARCH_RESULT_LIST_ADAPTER
+from api.responses import json_response
 from core.services.search_service import SearchService
 
 
 router = APIRouter(prefix="/search", tags=["search"])
 
 
-@router.get("", response_model=list[UnifiedSearchResultResponse])
+@router.get("", responses={200: {"model": list[UnifiedSearchResultResponse]}})
 async def search(
     q: str = Query(..., description="Search query"),
     limit: int = Query(10, ge=1, le=50, description="Maximum results"),
@@ -17,16 +18,9 @@ async def search(
     """Semantic search across characters, locations, and episodes."""
     try:
         results = await search_service.semantic_search(q, limit=limit)
-        return [
-            UnifiedSearchResultResponse(
-                entity_type=result.entity_type,
-                entity_id=result.entity_id,
-                name=result.name,
-                snippet=result.snippet,
-                similarity=result.similarity,
-            )
-            for result in results
-        ]
+        return json_response(
+            SEARCH_RESULT_LIST_ADAPTER.dump_json(SEARCH_RESULT_LIST_ADAPTER.validate_python(results))
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -1,5 +1,5 @@
 """Domain models."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -12,9 +12,10 @@ class Location:
     type: str
     dimension: str
     residents: list["Character"]
+    resident_count: int = 0  # Denormalized, set at fetch time even when residents aren't loaded
 
 
-@dataclass
+@dataclass(slots=True)
 class Character:
     """Character domain model."""
     id: int
@@ -30,6 +31,36 @@ class Character:
     episodes_data: list["Episode"] | None = None  # Full episode objects when available
     url: str = ""
     created: str = ""
+    _context: dict[str, Any] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Coerce origin/location to dicts once so consumers can trust them."""
+        if not isinstance(self.origin, dict):
+            self.origin = {}
+        if not isinstance(self.location, dict):
+            self.location = {}
+        # Built once; client-cached characters share it across generation contexts
+        self._context = {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "species": self.species,
+        }
+    
+    @property
+    def origin_name(self) -> str:
+        """Name of the origin location ("" when unknown)."""
+        return self.origin.get("name", "")
+    
+    @property
+    def location_name(self) -> str:
+        """Name of the last known location ("" when unknown)."""
+        return self.location.get("name", "")
+    
+    @property
+    def context(self) -> dict[str, Any]:
+        """Identity fields used in generation contexts (treat as read-only)."""
+        return self._context
 
 
 @dataclass
@@ -40,6 +71,12 @@ class Note:
     subject_id: int
     note_text: str
     created_at: datetime
+    created_at_iso: str = field(default="", repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Format created_at once, unless the loader already supplied the string."""
+        if not self.created_at_iso:
+            self.created_at_iso = self.created_at.isoformat()
 
 
 @dataclass
@@ -77,6 +114,7 @@ class Episode:
     characters_data: list["Character"] | None = None  # Full character objects when available
     url: str = ""
     created: str = ""
+    character_count: int = 0  # Denormalized len(characters), set at fetch time
 
 
 @dataclass
@@ -1,4 +1,5 @@
 """Protocols defining interfaces for infrastructure dependencies."""
+import numpy as np
 from typing import Protocol, Any
 from core.models import (
     Character,
@@ -18,10 +19,18 @@ class RickAndMortyClient(Protocol):
         """Fetch all locations with residents."""
         ...
     
+    async def get_locations_page(self, page: int) -> tuple[list[Location], int]:
+        """Fetch one upstream page of locations (no residents). Returns (locations, total_count)."""
+        ...
+    
     async def get_location(self, location_id: int) -> Location:
         """Fetch a specific location by ID."""
         ...
     
+    async def ensure_location_exists(self, location_id: int) -> None:
+        """Raise as get_location would if the location does not exist."""
+        ...
+    
     async def get_character(self, character_id: int) -> Character:
         """Fetch a specific character by ID."""
         ...
@@ -34,10 +43,18 @@ class RickAndMortyClient(Protocol):
         """Fetch all characters."""
         ...
     
+    async def get_characters_page(self, page: int) -> tuple[list[Character], int]:
+        """Fetch one upstream page of characters. Returns (characters, total_count)."""
+        ...
+    
     async def get_episodes(self) -> list[Episode]:
         """Fetch all episodes."""
         ...
     
+    async def get_episodes_page(self, page: int) -> tuple[list[Episode], int]:
+        """Fetch one upstream page of episodes. Returns (episodes, total_count)."""
+        ...
+    
     async def get_episode(self, episode_id: int) -> Episode:
         """Fetch a specific episode by ID."""
         ...
@@ -45,6 +62,10 @@ class RickAndMortyClient(Protocol):
     async def get_episodes_by_ids(self, episode_ids: list[int]) -> list[Episode]:
         """Fetch multiple episodes by IDs."""
         ...
+    
+    async def close(self) -> None:
+        """Release pooled upstream connections."""
+        ...
 
 
 class NoteRepository(Protocol):
@@ -119,8 +140,8 @@ class LLMProvider(Protocol):
         """Generate text from a prompt."""
         ...
     
-    async def get_embedding(self, text: str) -> list[float]:
-        """Get embedding vector for text."""
+    async def get_embedding(self, text: str) -> np.ndarray:
+        """Get embedding vector (float32) for text."""
         ...
 
 
@@ -134,19 +155,27 @@ class EvaluationProvider(Protocol):
     ) -> EvaluationResult:
         """Evaluate generated text."""
         ...
+    
+    def heuristic_scores(
+        self,
+        generated_text: str,
+        factual_context: dict[str, Any],
+    ) -> tuple[float, float, float]:
+        """Score factual consistency, completeness and relevance without the LLM."""
+        ...
 
 
 class VectorStore(Protocol):
     """Interface for vector storage and search."""
     
     async def upsert_character(
-        self, character: Character, embedding: list[float]
+        self, character: Character, embedding: np.ndarray
     ) -> None:
         """Store character with embedding."""
         ...
     
     async def search(
-        self, query_embedding: list[float], limit: int = 10
+        self, query_embedding: np.ndarray, limit: int = 10
     ) -> list[SearchResult]:
         """Search for similar characters."""
         ...
@@ -0,0 +1,17 @@
+"""Parsing of Rick & Morty resource references."""
+import re
+from typing import Iterable
+
+# Trailing numeric id of a resource URL ("https://.../api/episode/28") or a bare id ("28")
+_RESOURCE_ID_RE = re.compile(r"(?:^|/)(\d+)/?$")
+
+
+def parse_resource_ids(refs: Iterable[str | int]) -> list[int]:
+    """Extract ids from resource URLs or bare ids, skipping anything malformed."""
+    ids: list[int] = []
+    for ref in refs:
+        if isinstance(ref, int):
+            ids.append(ref)
+        elif match := _RESOURCE_ID_RE.search(ref):
+            ids.append(int(match.group(1)))
+    return ids
@@ -1,9 +1,23 @@
 """Core service layer."""
-from core.services.location_service import LocationService
-from core.services.character_service import CharacterService
-from core.services.generation_service import GenerationService
-from core.services.search_service import SearchService
-from core.services.episode_service import EpisodeService
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from core.services.location_service import LocationService
+    from core.services.character_service import CharacterService
+    from core.services.generation_service import GenerationService
+    from core.services.search_service import SearchService
+    from core.services.episode_service import EpisodeService
+
+# Services are imported on first access (PEP 562) so that importing one
+# does not pull in the dependencies of all the others
+_SERVICE_MODULES = {
+    "LocationService": "location_service",
+    "CharacterService": "character_service",
+    "GenerationService": "generation_service",
+    "SearchService": "search_service",
+    "EpisodeService": "episode_service",
+}
 
 __all__ = [
     "LocationService",
@@ -13,3 +27,12 @@ __all__ = [
     "EpisodeService",
 ]
 
+
+def __getattr__(name: str) -> Any:
+    """Import a service class from its module on first access."""
+    module_name = _SERVICE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
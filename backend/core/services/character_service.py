@@ -1,6 +1,9 @@
 """Character service."""
+import asyncio
 from core.models import Character, Note
 from core.ports import RickAndMortyClient, CharacterRepository, NoteRepository
+from core.resource_ids import parse_resource_ids
+from core.services.pagination import fetch_page_slice
 
 
 class CharacterService:
@@ -26,8 +29,8 @@ class CharacterService:
         # Check if episodes_data is already populated from GraphQL query
         if character.episodes_data:
             return character, character.episodes_data
-        # Otherwise, fetch episodes separately
-        episodes = await self.get_character_episodes(character_id)
+        # Otherwise, fetch episodes for the character we already have
+        episodes = await self._fetch_episodes(character)
         return character, episodes
     
     async def get_all_characters(self) -> list[Character]:
@@ -36,31 +39,7 @@ class CharacterService:
     
     async def get_characters_paginated(self, page: int, limit: int) -> tuple[list[Character], int]:
         """Get paginated characters."""
-        # GraphQL API returns 20 items per page by default
-        # Calculate which GraphQL page we need
-        graphql_page = ((page - 1) * limit) // 20 + 1
-        start_offset = ((page - 1) * limit) % 20
-        
-        # Try to use page-specific method if available (more efficient)
-        if hasattr(self.api_client, 'get_characters_page'):
-            try:
-                characters, total_count = await self.api_client.get_characters_page(graphql_page)
-                # If we need a subset from this page
-                if start_offset > 0 or limit < 20:
-                    end_offset = start_offset + limit
-                    paginated = characters[start_offset:end_offset]
-                    return paginated, total_count
-                return characters, total_count
-            except AttributeError:
-                pass
-        
-        # Fallback: fetch all and paginate in memory
-        all_characters = await self.api_client.get_all_characters()
-        total = len(all_characters)
-        start = (page - 1) * limit
-        end = start + limit
-        paginated = all_characters[start:end]
-        return paginated, total
+        return await fetch_page_slice(self.api_client.get_characters_page, page, limit)
     
     async def get_character_with_notes(
         self, character_id: int
@@ -84,22 +63,16 @@ class CharacterService:
     async def get_character_episodes(self, character_id: int) -> list:
         """Get episodes for a character."""
         character = await self.get_character(character_id)
-        
-        # Extract episode IDs from episode URLs
-        episode_ids = []
-        for ep_url in character.episode:
-            try:
-                # URLs are like "https://rickandmortyapi.com/api/episode/1"
-                ep_id = int(ep_url.split("/")[-1])
-                episode_ids.append(ep_id)
-            except (ValueError, IndexError):
-                continue
-        
+        return await self._fetch_episodes(character)
+    
+    async def _fetch_episodes(self, character: Character) -> list:
+        """Fetch episode objects for an already-loaded character."""
+        # URLs are like "https://rickandmortyapi.com/api/episode/1"
+        episode_ids = parse_resource_ids(character.episode)
         if not episode_ids:
             return []
         
         # Use the API client to fetch episodes by IDs
-        from core.models import Episode
         episodes = await self.api_client.get_episodes_by_ids(episode_ids)
         return episodes
     
@@ -113,11 +86,13 @@ class CharacterService:
         return await self.note_repository.add_note(character_id, note_text)
     
     async def get_character_with_unified_notes(self, character_id: int) -> tuple[Character, list[Note]]:
-        """Get character with notes from unified repository."""
-        character = await self.get_character(character_id)
-        notes = []
-        if self.unified_note_repository:
-            notes = await self.unified_note_repository.get_notes("character", character_id)
+        """Get character with notes from unified repository, fetching both concurrently."""
+        if not self.unified_note_repository:
+            return await self.get_character(character_id), []
+        character, notes = await asyncio.gather(
+            self.get_character(character_id),
+            self.unified_note_repository.get_notes("character", character_id),
+        )
         return character, notes
     
     async def update_note(self, note_id: int, note_text: str) -> Note:
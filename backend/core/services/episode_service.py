@@ -1,6 +1,9 @@
 """Episode service."""
+import asyncio
 from core.models import Episode, Note
 from core.ports import RickAndMortyClient, NoteRepository
+from core.resource_ids import parse_resource_ids
+from core.services.pagination import fetch_page_slice
 
 
 class EpisodeService:
@@ -16,31 +19,7 @@ class EpisodeService:
     
     async def get_episodes_paginated(self, page: int, limit: int) -> tuple[list[Episode], int]:
         """Get paginated episodes."""
-        # GraphQL API returns 20 items per page by default
-        # Calculate which GraphQL page we need
-        graphql_page = ((page - 1) * limit) // 20 + 1
-        start_offset = ((page - 1) * limit) % 20
-        
-        # Try to use page-specific method if available (more efficient)
-        if hasattr(self.api_client, 'get_episodes_page'):
-            try:
-                episodes, total_count = await self.api_client.get_episodes_page(graphql_page)
-                # If we need a subset from this page
-                if start_offset > 0 or limit < 20:
-                    end_offset = start_offset + limit
-                    paginated = episodes[start_offset:end_offset]
-                    return paginated, total_count
-                return episodes, total_count
-            except AttributeError:
-                pass
-        
-        # Fallback: fetch all and paginate in memory
-        all_episodes = await self.api_client.get_episodes()
-        total = len(all_episodes)
-        start = (page - 1) * limit
-        end = start + limit
-        paginated = all_episodes[start:end]
-        return paginated, total
+        return await fetch_page_slice(self.api_client.get_episodes_page, page, limit)
     
     async def get_episode(self, episode_id: int) -> Episode:
         """Get a specific episode by ID."""
@@ -50,19 +29,8 @@ class EpisodeService:
         """Get episode with populated character objects."""
         episode = await self.get_episode(episode_id)
         
-        # Extract character IDs from episode.characters (list of IDs or URLs)
-        character_ids = []
-        for char_ref in episode.characters:
-            if isinstance(char_ref, str):
-                # It's a URL, extract ID
-                try:
-                    char_id = int(char_ref.split("/")[-1])
-                    character_ids.append(char_id)
-                except (ValueError, IndexError):
-                    continue
-            elif isinstance(char_ref, int):
-                character_ids.append(char_ref)
-        
+        # episode.characters holds IDs or URLs
+        character_ids = parse_resource_ids(episode.characters)
         characters = []
         if character_ids:
             characters = await self.api_client.get_characters(character_ids)
@@ -70,11 +38,13 @@ class EpisodeService:
         return episode, characters
     
     async def get_episode_with_notes(self, episode_id: int) -> tuple[Episode, list[Note]]:
-        """Get episode with associated notes."""
-        episode = await self.get_episode(episode_id)
-        notes = []
-        if self.note_repository:
-            notes = await self.note_repository.get_notes("episode", episode_id)
+        """Get episode with associated notes, fetching both concurrently."""
+        if not self.note_repository:
+            return await self.get_episode(episode_id), []
+        episode, notes = await asyncio.gather(
+            self.get_episode(episode_id),
+            self.note_repository.get_notes("episode", episode_id),
+        )
         return episode, notes
     
     async def add_note(self, episode_id: int, note_text: str) -> Note:
@@ -1,5 +1,14 @@
 """AI generation service."""
+import asyncio
 import json
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Sequence, TypeVar
+import numpy as np
+import orjson
+from cachetools import LRUCache, TTLCache
 from core.models import GeneratedContent, Generation
 from core.ports import (
     RickAndMortyClient,
@@ -8,11 +17,99 @@ from core.ports import (
     GeneratedContentRepository,
     NoteRepository,
 )
+from core.resource_ids import parse_resource_ids
+from core.services.episode_service import EpisodeService
+from core.services.semantic_cache import SemanticCache, context_digest
+from core.services.single_flight import single_flight
 from infrastructure.repositories.generation_repository import SQLiteGenerationRepository
 from infrastructure.repositories.search_index_repository import SQLiteSearchIndexRepository
 from infrastructure.workers.job_queue import job_queue
+from shared.config import settings
 from shared.logging import logger
 
+T = TypeVar("T")
+
+
+# Fixed system prompts, sent ahead of the per-request prompt so provider-side
+# prefix caching can reuse them across calls
+_LOCATION_SUMMARY_SYSTEM_PROMPT = (
+    "You are a narrator for the Rick and Morty universe. "
+    "Write engaging, witty summaries in the tone of the show."
+)
+
+_EPISODE_SUMMARY_SYSTEM_PROMPT = (
+    "You are a narrator for the Rick and Morty universe. "
+    "Write engaging, witty episode summaries in the tone of the show."
+)
+
+_CHARACTER_SUMMARY_SYSTEM_PROMPT = (
+    "You are a narrator for the Rick and Morty universe. "
+    "Write engaging, witty character summaries in the tone of the show."
+)
+
+_DIALOGUE_SYSTEM_PROMPT = (
+    "You are a writer for Rick and Morty. "
+    "Write authentic dialogue that matches each character's personality."
+)
+
+_SUMMARY_SYSTEM_PROMPT = (
+    "You are a sarcastic, in-universe narrator from Rick & Morty. "
+    "Summarize this in 3-5 sentences. Be irreverent and funny, but stay "
+    "consistent with the structured data below. Do not invent characters "
+    "or contradict facts. Output only plain text - no markdown or JSON."
+)
+
+_NOTE_REWRITE_SYSTEM_PROMPT = (
+    "You are a helpful writing assistant for Rick & Morty notes. "
+    "Improve and enhance the given note text while keeping it concise "
+    "and relevant to the entity. Keep it under 300 words. "
+    "Maintain the original meaning and style if provided, or create "
+    "engaging content in the Rick & Morty tone if the text is minimal."
+)
+
+
+_WORD_RE = re.compile(r"\S+")
+
+# Most recent distinct topics kept in the dialogue cache for one character pair
+_DIALOGUE_TOPICS_PER_PAIR = 32
+
+# Canonical header of each search index text blob; optional lines are passed
+# in pre-formatted (with their leading newline) or as ""
+_CHARACTER_INDEX_TEMPLATE = (
+    "Name: {name}\nSpecies: {species}\nStatus: {status}\nType: {type}\n"
+    "Gender: {gender}{origin}{location}\nEpisodes: {episodes}"
+)
+_LOCATION_INDEX_TEMPLATE = (
+    "Name: {name}\nType: {type}\nDimension: {dimension}\n"
+    "Residents: {resident_count}{residents}"
+)
+_EPISODE_INDEX_TEMPLATE = "Title: {name}\nEpisode: {episode}\nAir Date: {air_date}{characters}"
+
+# Entity types with a search index entry, and the generated summary each one embeds
+_INDEX_SUMMARY_PROMPT_TYPES = {
+    "character": "character_summary",
+    "location": "location_summary",
+    "episode": "episode_summary",
+}
+
+# How long a search index flush waits for concurrent writes to join its transaction
+_INDEX_WRITE_WINDOW = 0.02  # seconds
+
+
+def _names_preview(items: Sequence[Any], n: int = 5) -> tuple[str, bool]:
+    """Join the first n names; the flag says whether any were left out."""
+    return ", ".join(item.name for item in islice(items, n)), len(items) > n
+
+
+def _truncate_words(text: str, limit: int) -> str:
+    """Cut text after `limit` words (adding "..."), scanning no further than needed."""
+    end = 0
+    for count, match in enumerate(_WORD_RE.finditer(text), 1):
+        if count > limit:
+            return text[:end] + "..."
+        end = match.end()
+    return text
+
 
 class GenerationService:
     """Service for AI-powered content generation."""
@@ -30,9 +127,64 @@ class GenerationService:
         self.evaluator = evaluator
         self.content_repository = content_repository
         self.note_repository = note_repository
+        self.episode_service = EpisodeService(api_client)
         self.generation_repository = SQLiteGenerationRepository()
         self.search_index_repo = SQLiteSearchIndexRepository()
+        # Dialogues keyed on their topic embedding, per character pair. Summaries don't
+        # need it: their context is fixed by the subject id, which the repository matches
+        self.semantic_cache: SemanticCache[GeneratedContent] = SemanticCache(
+            settings.generation_cache_threshold,
+            settings.generation_cache_size,
+            max_per_scope=_DIALOGUE_TOPICS_PER_PAIR,
+        )
+        # Context embeddings keyed by SHA-256 of the context, so retries never re-embed
+        self._context_embeddings: LRUCache = LRUCache(maxsize=settings.generation_cache_size)
+        # Canonical grounding data keyed by (entity_type, entity_id); it rarely changes
+        self._canonical_contexts: TTLCache = TTLCache(
+            maxsize=settings.canonical_context_cache_size, ttl=settings.canonical_context_ttl
+        )
+        # Concurrent requests for the same summary share one LLM call (see single_flight)
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        # Heuristic scoring is CPU-bound regex work; a process pool keeps it off
+        # the GIL the event loop needs. Spawned, since fork copies live DB threads.
+        self._eval_pool: ProcessPoolExecutor | None = (
+            ProcessPoolExecutor(
+                max_workers=settings.evaluation_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            if settings.evaluation_workers > 0
+            else None
+        )
+        # Search index writes waiting to be flushed together (see _write_index_entry)
+        self._index_batch: list[tuple[str, str, str, np.ndarray]] = []
+        self._index_flush: asyncio.Task | None = None
     
+    def close(self) -> None:
+        """Shut down the scoring process pool."""
+        if self._eval_pool is not None:
+            self._eval_pool.shutdown(wait=False, cancel_futures=True)
+            self._eval_pool = None
+    
+    async def _run_scoring(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a synchronous evaluator method in the scoring pool (default thread pool if disabled)."""
+        return await asyncio.get_running_loop().run_in_executor(self._eval_pool, func, *args)
+    
+    async def _context_embedding(self, context: dict) -> np.ndarray | None:
+        """Embed a generation context for the semantic cache; None if embedding fails."""
+        digest = context_digest(context)
+        embedding = self._context_embeddings.get(digest)
+        if embedding is None:
+            try:
+                embedding = await self.llm_provider.get_embedding(
+                    json.dumps(context, sort_keys=True)
+                )
+            except Exception as e:
+                logger.warning(f"Skipping semantic cache, context embedding failed: {e}")
+                return None
+            self._context_embeddings[digest] = embedding
+        return embedding
+    
+    @single_flight
     async def generate_location_summary(
         self, location_id: int
     ) -> GeneratedContent:
@@ -56,34 +208,21 @@ class GenerationService:
                 "type": location.type,
                 "dimension": location.dimension,
             },
-            "residents": [
-                {
-                    "id": char.id,
-                    "name": char.name,
-                    "status": char.status,
-                    "species": char.species,
-                }
-                for char in location.residents
-            ],
+            "residents": [char.context for char in location.residents],
         }
         
         # Build prompt
-        system_prompt = (
-            "You are a narrator for the Rick and Morty universe. "
-            "Write engaging, witty summaries in the tone of the show."
-        )
-        
+        names, truncated = _names_preview(location.residents)
         prompt = (
             f"Write a creative, engaging summary of the location '{location.name}' "
             f"({location.type} in {location.dimension}). "
             f"Include interesting details about its {len(location.residents)} residents: "
-            f"{', '.join([char.name for char in location.residents[:5]])}"
-            f"{' and more' if len(location.residents) > 5 else ''}. "
+            f"{names}{' and more' if truncated else ''}. "
             f"Keep it fun, informative, and true to the Rick and Morty style."
         )
         
         # Generate
-        output_text = await self.llm_provider.generate(prompt, system_prompt)
+        output_text = await self.llm_provider.generate(prompt, _LOCATION_SUMMARY_SYSTEM_PROMPT)
         
         # Save with placeholder scores (-1 indicates processing)
         content = GeneratedContent(
@@ -106,6 +245,7 @@ class GenerationService:
             "type": "SCORE_GENERATED_CONTENT",
             "content_id": saved_content.id,
             "subject_id": location_id,
+            "entity_type": "location",
             "prompt_type": "location_summary",
             "generated_text": output_text,
             "factual_context": context,
@@ -113,6 +253,7 @@ class GenerationService:
         
         return saved_content
     
+    @single_flight
     async def generate_episode_summary(
         self, episode_id: int
     ) -> GeneratedContent:
@@ -125,9 +266,7 @@ class GenerationService:
             return existing
         
         # Fetch episode data
-        from core.services.episode_service import EpisodeService
-        episode_service = EpisodeService(self.api_client)
-        episode, characters = await episode_service.get_episode_with_characters(episode_id)
+        episode, characters = await self.episode_service.get_episode_with_characters(episode_id)
         
         # Build factual context
         context = {
@@ -148,22 +287,17 @@ class GenerationService:
         }
         
         # Build prompt
-        system_prompt = (
-            "You are a narrator for the Rick and Morty universe. "
-            "Write engaging, witty episode summaries in the tone of the show."
-        )
-        
+        names, truncated = _names_preview(characters)
         prompt = (
             f"Write a creative, engaging summary of the episode '{episode.name}' "
             f"(Episode {episode.episode}, aired {episode.air_date}). "
             f"Include details about the {len(characters)} characters involved: "
-            f"{', '.join([char.name for char in characters[:5]])}"
-            f"{' and more' if len(characters) > 5 else ''}. "
+            f"{names}{' and more' if truncated else ''}. "
             f"Keep it fun, informative, and true to the Rick and Morty style."
         )
         
         # Generate
-        output_text = await self.llm_provider.generate(prompt, system_prompt)
+        output_text = await self.llm_provider.generate(prompt, _EPISODE_SUMMARY_SYSTEM_PROMPT)
         
         # Save with placeholder scores
         content = GeneratedContent(
@@ -186,6 +320,7 @@ class GenerationService:
             "type": "SCORE_GENERATED_CONTENT",
             "content_id": saved_content.id,
             "subject_id": episode_id,
+            "entity_type": "episode",
             "prompt_type": "episode_summary",
             "generated_text": output_text,
             "factual_context": context,
@@ -193,6 +328,7 @@ class GenerationService:
         
         return saved_content
     
+    @single_flight
     async def generate_character_summary(
         self, character_id: int
     ) -> GeneratedContent:
@@ -220,19 +356,8 @@ class GenerationService:
             ]
         
         # Build factual context
-        origin_name = ""
-        if character.origin:
-            if isinstance(character.origin, dict):
-                origin_name = character.origin.get("name", "")
-            else:
-                origin_name = ""
-        
-        location_name = ""
-        if character.location:
-            if isinstance(character.location, dict):
-                location_name = character.location.get("name", "")
-            else:
-                location_name = ""
+        origin_name = character.origin_name
+        location_name = character.location_name
         
         context = {
             "character": {
@@ -249,11 +374,6 @@ class GenerationService:
         }
         
         # Build prompt
-        system_prompt = (
-            "You are a narrator for the Rick and Morty universe. "
-            "Write engaging, witty character summaries in the tone of the show."
-        )
-        
         origin_text = f"From {origin_name}" if origin_name else ""
         location_text = f"Currently located at {location_name}" if location_name else ""
         episodes_text = f"Appears in {len(episodes_info)} episodes" if episodes_info else "Has appeared in multiple episodes"
@@ -268,7 +388,7 @@ class GenerationService:
         )
         
         # Generate
-        output_text = await self.llm_provider.generate(prompt, system_prompt)
+        output_text = await self.llm_provider.generate(prompt, _CHARACTER_SUMMARY_SYSTEM_PROMPT)
         
         # Save with placeholder scores
         content = GeneratedContent(
@@ -291,6 +411,7 @@ class GenerationService:
             "type": "SCORE_GENERATED_CONTENT",
             "content_id": saved_content.id,
             "subject_id": character_id,
+            "entity_type": "character",
             "prompt_type": "character_summary",
             "generated_text": output_text,
             "factual_context": context,
@@ -306,25 +427,21 @@ class GenerationService:
         char2 = await self.api_client.get_character(character_id2)
         
         context = {
-            "character1": {
-                "id": char1.id,
-                "name": char1.name,
-                "species": char1.species,
-                "status": char1.status,
-            },
-            "character2": {
-                "id": char2.id,
-                "name": char2.name,
-                "species": char2.species,
-                "status": char2.status,
-            },
+            "character1": char1.context,
+            "character2": char2.context,
             "topic": topic or "general conversation",
         }
         
-        system_prompt = (
-            "You are a writer for Rick and Morty. "
-            "Write authentic dialogue that matches each character's personality."
-        )
+        # Reuse a dialogue for the same pair whose topic is near-identical; only the
+        # topic is embedded, since the character blocks are fixed per pair
+        normalized_topic = " ".join(context["topic"].lower().split())
+        scope = (character_id1, character_id2)
+        embedding = await self._context_embedding({"topic": normalized_topic})
+        if embedding is not None:
+            cached = self.semantic_cache.lookup("character_dialogue", scope, embedding)
+            if cached is not None:
+                logger.info(f"Semantic cache hit for dialogue {character_id1}/{character_id2}")
+                return cached
         
         prompt = (
             f"Write a short, engaging dialogue between {char1.name} "
@@ -334,9 +451,9 @@ class GenerationService:
             f"Maximum 10-12 exchanges between them."
         )
         
-        output_text = await self.llm_provider.generate(prompt, system_prompt)
+        output_text = await self.llm_provider.generate(prompt, _DIALOGUE_SYSTEM_PROMPT)
         
-        evaluation = self.evaluator.evaluate(output_text, context)
+        evaluation = await self._run_scoring(self.evaluator.evaluate, output_text, context)
         
         content = GeneratedContent(
             id=0,
@@ -351,8 +468,12 @@ class GenerationService:
             created_at=None,
         )
         
-        return await self.content_repository.save(content)
+        saved_content = await self.content_repository.save(content)
+        if embedding is not None:
+            self.semantic_cache.store("character_dialogue", scope, embedding, saved_content)
+        return saved_content
     
+    @single_flight
     async def generate_summary(
         self, entity_type: str, entity_id: str
     ) -> Generation:
@@ -370,17 +491,10 @@ class GenerationService:
         )
         
         # Build prompt
-        system_prompt = (
-            "You are a sarcastic, in-universe narrator from Rick & Morty. "
-            "Summarize this in 3-5 sentences. Be irreverent and funny, but stay "
-            "consistent with the structured data below. Do not invent characters "
-            "or contradict facts. Output only plain text - no markdown or JSON."
-        )
-        
         prompt = self._build_prompt(entity_type, canonical_context)
         
         # Generate summary
-        summary_text = await self.llm_provider.generate(prompt, system_prompt)
+        summary_text = await self.llm_provider.generate(prompt, _SUMMARY_SYSTEM_PROMPT)
         
         # Store with INITIATED status
         generation = await self.generation_repository.create_initiated(
@@ -400,6 +514,17 @@ class GenerationService:
     
     async def _fetch_canonical_context(
         self, entity_type: str, entity_id: int
+    ) -> dict:
+        """Fetch canonical context for grounding, cached per entity (read-only)."""
+        key = (entity_type, entity_id)
+        context = self._canonical_contexts.get(key)
+        if context is None:
+            context = await self._load_canonical_context(entity_type, entity_id)
+            self._canonical_contexts[key] = context
+        return context
+    
+    async def _load_canonical_context(
+        self, entity_type: str, entity_id: int
     ) -> dict:
         """Fetch canonical context for grounding."""
         if entity_type == "location":
@@ -419,20 +544,12 @@ class GenerationService:
             }
         elif entity_type == "character":
             character = await self.api_client.get_character(entity_id)
-            origin_name = ""
-            if character.origin and isinstance(character.origin, dict):
-                origin_name = character.origin.get("name", "")
-            
-            location_name = ""
-            if character.location and isinstance(character.location, dict):
-                location_name = character.location.get("name", "")
-            
             return {
                 "name": character.name,
                 "status": character.status,
                 "species": character.species,
-                "origin": origin_name,
-                "lastKnownLocation": location_name,
+                "origin": character.origin_name,
+                "lastKnownLocation": character.location_name,
             }
         elif entity_type == "episode":
             episode = await self.api_client.get_episode(entity_id)
@@ -441,23 +558,14 @@ class GenerationService:
             if hasattr(episode, 'characters_data') and episode.characters_data:
                 characters_list = [char.name for char in episode.characters_data]
             elif hasattr(episode, 'characters') and episode.characters:
-                # If we have character URLs, extract IDs and fetch
-                character_ids = []
-                for char_url in episode.characters[:10]:  # Limit to 10
-                    if isinstance(char_url, str) and '/character/' in char_url:
-                        try:
-                            char_id = int(char_url.split('/character/')[-1])
-                            character_ids.append(char_id)
-                        except:
-                            pass
-                
-                # Fetch character names
-                for char_id in character_ids[:5]:  # Limit to 5 for context
+                # Character refs are IDs or URLs; fetch names in one batch request
+                character_ids = parse_resource_ids(episode.characters[:10])[:5]  # Limit to 5 for context
+                if character_ids:
                     try:
-                        char = await self.api_client.get_character(char_id)
-                        characters_list.append(char.name)
-                    except:
-                        pass
+                        characters = await self.api_client.get_characters(character_ids)
+                        characters_list = [char.name for char in characters]
+                    except Exception as e:
+                        logger.warning(f"Error fetching characters for episode {entity_id}: {e}")
             
             return {
                 "title": episode.name,
@@ -470,7 +578,7 @@ class GenerationService:
     
     def _build_prompt(self, entity_type: str, context: dict) -> str:
         """Build prompt from canonical context."""
-        context_json = json.dumps(context, indent=2)
+        context_json = orjson.dumps(context, option=orjson.OPT_INDENT_2).decode()
         
         if entity_type == "location":
             return (
@@ -500,24 +608,14 @@ class GenerationService:
         summary_text = job["summaryText"]
         canonical_context = job["canonicalContext"]
         
-        # 1. Evaluate factual consistency
-        factual_score = self.evaluator._compute_factual_score(
-            summary_text, canonical_context
-        )
-        
-        # 2. Evaluate creativity (async LLM judge)
-        creativity_score = await self.evaluator.score_creativity_async(
-            summary_text, self.llm_provider
-        )
-        
-        # 3. Evaluate completeness
-        completeness_score = self.evaluator._compute_completeness_score(
-            summary_text, canonical_context
-        )
-        
-        # 4. Evaluate relevance
-        relevance_score = self.evaluator._compute_relevance_score(
-            summary_text, canonical_context
+        # 1-4. Heuristics run in the scoring pool while the LLM judges creativity
+        (factual_score, completeness_score, relevance_score), creativity_score = (
+            await asyncio.gather(
+                self._run_scoring(
+                    self.evaluator.heuristic_scores, summary_text, canonical_context
+                ),
+                self.evaluator.score_creativity_async(summary_text, self.llm_provider),
+            )
         )
         
         # 5. Update database
@@ -546,7 +644,9 @@ class GenerationService:
         factual_context = job["factual_context"]
         
         # Evaluate
-        evaluation = self.evaluator.evaluate(generated_text, factual_context)
+        evaluation = await self._run_scoring(
+            self.evaluator.evaluate, generated_text, factual_context
+        )
         
         # Update scores in database
         await self.content_repository.update_scores(
@@ -566,22 +666,7 @@ class GenerationService:
         )
         
         # Rebuild search index for this entity
-        # Extract entity info from the saved content
-        saved_content = await self.content_repository.get_by_subject(
-            job.get("subject_id", 0), job.get("prompt_type", "")
-        )
-        if saved_content:
-            content = saved_content[0] if saved_content else None
-            if content:
-                # Determine entity type from prompt_type
-                entity_type_map = {
-                    "location_summary": "location",
-                    "character_summary": "character",
-                    "episode_summary": "episode",
-                }
-                entity_type = entity_type_map.get(content.prompt_type)
-                if entity_type:
-                    await self.rebuild_search_index(entity_type, str(content.subject_id))
+        await self.rebuild_search_index(job["entity_type"], str(job["subject_id"]))
     
     async def regenerate_note_text(
         self, note_text: str, entity_type: str, entity_id: int
@@ -593,9 +678,7 @@ class GenerationService:
             context_info = f"Location: {location.name} ({location.type} in {location.dimension})"
             entity_context = f"{len(location.residents)} residents"
         elif entity_type == "episode":
-            from core.services.episode_service import EpisodeService
-            episode_service = EpisodeService(self.api_client)
-            episode, characters = await episode_service.get_episode_with_characters(entity_id)
+            episode, characters = await self.episode_service.get_episode_with_characters(entity_id)
             context_info = f"Episode: {episode.name} (Episode {episode.episode}, aired {episode.air_date})"
             entity_context = f"{len(characters)} characters"
         elif entity_type == "character":
@@ -606,14 +689,6 @@ class GenerationService:
             raise ValueError(f"Unknown entity type: {entity_type}")
         
         # Build prompt
-        system_prompt = (
-            "You are a helpful writing assistant for Rick & Morty notes. "
-            "Improve and enhance the given note text while keeping it concise "
-            "and relevant to the entity. Keep it under 300 words. "
-            "Maintain the original meaning and style if provided, or create "
-            "engaging content in the Rick & Morty tone if the text is minimal."
-        )
-        
         prompt = (
             f"Improve and enhance this note about {context_info}:\n\n"
             f"Original note:\n{note_text}\n\n"
@@ -624,116 +699,137 @@ class GenerationService:
         )
         
         # Generate improved text
-        improved_text = await self.llm_provider.generate(prompt, system_prompt)
+        improved_text = await self.llm_provider.generate(prompt, _NOTE_REWRITE_SYSTEM_PROMPT)
         
         # Limit to 300 words as requested
-        words = improved_text.split()
-        if len(words) > 300:
-            improved_text = " ".join(words[:300]) + "..."
+        improved_text = _truncate_words(improved_text, 300)
         
         return improved_text.strip()
     
+    async def _write_index_entry(
+        self, entity_type: str, entity_id: str, text_blob: str, embedding: np.ndarray
+    ) -> None:
+        """Upsert a search index entry, sharing one transaction with concurrent rebuilds."""
+        # Rejected here, before a bad vector can fail the shared batch
+        self.search_index_repo.validate_embedding(embedding)
+        self._index_batch.append((entity_type, entity_id, text_blob, embedding))
+        if self._index_flush is None:
+            self._index_flush = asyncio.create_task(self._flush_index_batch())
+        # Shielded so a cancelled writer doesn't cancel the flush for everyone else
+        await asyncio.shield(self._index_flush)
+    
+    async def _flush_index_batch(self) -> None:
+        """Write every entry queued during the coalescing window in one upsert_many."""
+        await asyncio.sleep(_INDEX_WRITE_WINDOW)
+        batch, self._index_batch = self._index_batch, []
+        self._index_flush = None
+        await self.search_index_repo.upsert_many(batch)
+    
+    async def _index_header(self, entity_type: str, entity_id: int) -> str:
+        """Format the canonical-data header of an entity's search index text."""
+        if entity_type == "character":
+            entity = await self.api_client.get_character(entity_id)
+            origin_name = entity.origin_name
+            location_name = entity.location_name
+            return _CHARACTER_INDEX_TEMPLATE.format(
+                name=entity.name,
+                species=entity.species,
+                status=entity.status,
+                type=entity.type or "Unknown",
+                gender=entity.gender,
+                origin=f"\nOrigin: {origin_name}" if origin_name else "",
+                location=f"\nLocation: {location_name}" if location_name else "",
+                episodes=len(entity.episode) if entity.episode else 0,
+            )
+        
+        if entity_type == "location":
+            entity = await self.api_client.get_location(entity_id)
+            residents = ""
+            if entity.residents:
+                resident_names, _ = _names_preview(entity.residents, 10)
+                residents = f"\nResidents include: {resident_names}"
+            return _LOCATION_INDEX_TEMPLATE.format(
+                name=entity.name,
+                type=entity.type,
+                dimension=entity.dimension,
+                resident_count=len(entity.residents),
+                residents=residents,
+            )
+        
+        entity = await self.api_client.get_episode(entity_id)
+        characters = ""
+        if hasattr(entity, 'characters_data') and entity.characters_data:
+            char_names, _ = _names_preview(entity.characters_data, 10)
+            characters = f"\nCharacters: {char_names}"
+        elif hasattr(entity, 'characters') and entity.characters:
+            characters = f"\nCharacters: {len(entity.characters)} characters"
+        return _EPISODE_INDEX_TEMPLATE.format(
+            name=entity.name,
+            episode=entity.episode,
+            air_date=entity.air_date,
+            characters=characters,
+        )
+    
+    async def _index_note_lines(self, entity_type: str, entity_id: int) -> list[str]:
+        """User-note lines of an entity's search index text (empty on failure)."""
+        if not self.note_repository:
+            return []
+        try:
+            notes = await self.note_repository.get_notes(entity_type, entity_id)
+        except Exception as e:
+            logger.warning(f"Error fetching notes for search index: {e}")
+            return []
+        note_texts = [note.note_text for note in notes[:5]]  # Limit to 5 most recent
+        if not note_texts:
+            return []
+        return ["\nUser notes:", *(f"- {note_text}" for note_text in note_texts)]
+    
+    async def _index_summary_lines(self, entity_type: str, entity_id: int) -> list[str]:
+        """AI-summary line of an entity's search index text, once it has been scored."""
+        try:
+            summary = await self.content_repository.get_latest_by_subject(
+                entity_id, _INDEX_SUMMARY_PROMPT_TYPES[entity_type]
+            )
+        except Exception as e:
+            logger.warning(f"Error fetching summary for search index: {e}")
+            return []
+        # Only include if scores are complete (not processing)
+        if summary and summary.output_text and summary.factual_score >= 0:
+            return [f"\nAI Summary: {summary.output_text[:500]}"]  # Limit length
+        return []
+    
     async def rebuild_search_index(
         self, entity_type: str, entity_id: str
     ) -> None:
         """Rebuild search index entry for an entity (character, location, or episode)."""
+        if entity_type not in _INDEX_SUMMARY_PROMPT_TYPES:
+            logger.warning(f"Unknown entity type for search index: {entity_type}")
+            return
         try:
             entity_id_int = int(entity_id)
             
-            # Build text blob from canonical data + notes + AI summary
-            text_parts = []
+            # Canonical data, notes, AI summary and the stored text are independent reads
+            header, note_lines, summary_lines, indexed_blob = await asyncio.gather(
+                self._index_header(entity_type, entity_id_int),
+                self._index_note_lines(entity_type, entity_id_int),
+                self._index_summary_lines(entity_type, entity_id_int),
+                self.search_index_repo.get_text_blob(entity_type, entity_id),
+            )
+            text_blob = "\n".join([header, *note_lines, *summary_lines])
             
-            # 1. Fetch canonical data
-            if entity_type == "character":
-                entity = await self.api_client.get_character(entity_id_int)
-                origin_name = ""
-                if entity.origin and isinstance(entity.origin, dict):
-                    origin_name = entity.origin.get("name", "")
-                location_name = ""
-                if entity.location and isinstance(entity.location, dict):
-                    location_name = entity.location.get("name", "")
-                
-                text_parts.append(f"Name: {entity.name}")
-                text_parts.append(f"Species: {entity.species}")
-                text_parts.append(f"Status: {entity.status}")
-                text_parts.append(f"Type: {entity.type or 'Unknown'}")
-                text_parts.append(f"Gender: {entity.gender}")
-                if origin_name:
-                    text_parts.append(f"Origin: {origin_name}")
-                if location_name:
-                    text_parts.append(f"Location: {location_name}")
-                text_parts.append(f"Episodes: {len(entity.episode) if entity.episode else 0}")
-                
-            elif entity_type == "location":
-                entity = await self.api_client.get_location(entity_id_int)
-                text_parts.append(f"Name: {entity.name}")
-                text_parts.append(f"Type: {entity.type}")
-                text_parts.append(f"Dimension: {entity.dimension}")
-                text_parts.append(f"Residents: {len(entity.residents)}")
-                if entity.residents:
-                    resident_names = ", ".join([char.name for char in entity.residents[:10]])
-                    text_parts.append(f"Residents include: {resident_names}")
-                    
-            elif entity_type == "episode":
-                entity = await self.api_client.get_episode(entity_id_int)
-                text_parts.append(f"Title: {entity.name}")
-                text_parts.append(f"Episode: {entity.episode}")
-                text_parts.append(f"Air Date: {entity.air_date}")
-                if hasattr(entity, 'characters_data') and entity.characters_data:
-                    char_names = ", ".join([char.name for char in entity.characters_data[:10]])
-                    text_parts.append(f"Characters: {char_names}")
-                elif hasattr(entity, 'characters') and entity.characters:
-                    text_parts.append(f"Characters: {len(entity.characters)} characters")
-            else:
-                logger.warning(f"Unknown entity type for search index: {entity_type}")
+            # Unchanged text embeds to the same vector; skip the API call and the write
+            if indexed_blob == text_blob:
+                logger.info(f"Search index for {entity_type}/{entity_id} is up to date")
                 return
             
-            # 2. Fetch notes
-            if self.note_repository:
-                try:
-                    notes = await self.note_repository.get_notes(entity_type, entity_id_int)
-                    if notes:
-                        note_texts = [note.note_text for note in notes[:5]]  # Limit to 5 most recent
-                        if note_texts:
-                            text_parts.append("\nUser notes:")
-                            for note_text in note_texts:
-                                text_parts.append(f"- {note_text}")
-                except Exception as e:
-                    logger.warning(f"Error fetching notes for search index: {e}")
-            
-            # 3. Fetch latest AI summary
-            prompt_type_map = {
-                "character": "character_summary",
-                "location": "location_summary",
-                "episode": "episode_summary",
-            }
-            prompt_type = prompt_type_map.get(entity_type)
-            if prompt_type:
-                try:
-                    summary = await self.content_repository.get_latest_by_subject(
-                        entity_id_int, prompt_type
-                    )
-                    if summary and summary.output_text:
-                        # Only include if scores are complete (not processing)
-                        if summary.factual_score >= 0:
-                            text_parts.append(f"\nAI Summary: {summary.output_text[:500]}")  # Limit length
-                except Exception as e:
-                    logger.warning(f"Error fetching summary for search index: {e}")
-            
-            # Combine into text blob
-            text_blob = "\n".join(text_parts)
-            
             # Get embedding
             embedding = await self.llm_provider.get_embedding(text_blob)
             
             # Upsert into search index
-            await self.search_index_repo.upsert_entry(
-                entity_type, entity_id, text_blob, embedding
-            )
+            await self._write_index_entry(entity_type, entity_id, text_blob, embedding)
             
             logger.info(f"Rebuilt search index for {entity_type}/{entity_id}")
             
         except Exception as e:
             logger.error(f"Error rebuilding search index for {entity_type}/{entity_id}: {e}")
             # Don't raise - search index rebuild should not break main flow
-
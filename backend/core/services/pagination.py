@@ -0,0 +1,69 @@
+"""Slicing API pages out of the upstream API's fixed-size pages."""
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+# The Rick & Morty API (REST and GraphQL) serves 20 items per page
+UPSTREAM_PAGE_SIZE = 20
+
+# Speculative next-page fetches in flight (strong references until they finish)
+_prefetches: set[asyncio.Task] = set()
+
+
+def _page_span(page: int, limit: int) -> tuple[int, int, int]:
+    """Return (first upstream page, last upstream page, offset into the first)."""
+    start = (page - 1) * limit
+    first_page = start // UPSTREAM_PAGE_SIZE + 1
+    last_page = (start + limit - 1) // UPSTREAM_PAGE_SIZE + 1
+    return first_page, last_page, start - (first_page - 1) * UPSTREAM_PAGE_SIZE
+
+
+def _prefetch_after(
+    fetch_page: Callable[[int], Awaitable[tuple[list[T], int]]],
+    last_page: int,
+    total_count: int,
+) -> None:
+    """Start fetching the upstream page after `last_page`, if there is one.
+    
+    Clients cache their pages, so a sequential reader's next request is served
+    from the cache (or joins this fetch if it is still in flight).
+    """
+    if last_page * UPSTREAM_PAGE_SIZE >= total_count:
+        return
+    task = asyncio.ensure_future(fetch_page(last_page + 1))
+    _prefetches.add(task)
+    task.add_done_callback(_prefetches.discard)
+    # Nobody awaits a prefetch; a failure just means the page is fetched on demand
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+async def fetch_page_slice(
+    fetch_page: Callable[[int], Awaitable[tuple[list[T], int]]],
+    page: int,
+    limit: int,
+) -> tuple[list[T], int]:
+    """Return items for (page, limit), fetching every upstream page it spans concurrently."""
+    first_page, last_page, offset = _page_span(page, limit)
+    
+    results = await asyncio.gather(
+        *(fetch_page(p) for p in range(first_page, last_page + 1)),
+        return_exceptions=True,
+    )
+    
+    first = results[0]
+    if isinstance(first, BaseException):
+        raise first
+    _, total_count = first
+    
+    items: list[T] = []
+    for upstream_page, result in zip(range(first_page, last_page + 1), results):
+        if isinstance(result, BaseException):
+            # Pages past the end of the collection may error upstream; anything else is real
+            if (upstream_page - 1) * UPSTREAM_PAGE_SIZE >= total_count:
+                break
+            raise result
+        items.extend(result[0])
+    
+    _prefetch_after(fetch_page, last_page, total_count)
+    return items[offset:offset + limit], total_count
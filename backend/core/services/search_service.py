@@ -1,10 +1,27 @@
 """Semantic search service."""
+import asyncio
 import numpy as np
+from cachetools import TTLCache
 from dataclasses import dataclass
 from core.ports import LLMProvider
+from core.services.semantic_cache import SemanticCache
+from core.services.single_flight import single_flight
 from infrastructure.repositories.search_index_repository import SQLiteSearchIndexRepository
+from shared.config import settings
 from shared.logging import logger
 
+try:
+    import simsimd  # type: ignore[import-untyped]
+except ImportError:  # optional: without it every query uses the float32 product
+    simsimd = None
+
+# int8 candidates kept per requested result before exact float32 rescoring
+_RERANK_FACTOR = 4
+
+# Matrices at least this large (~650 x 1536) are scored off the event loop;
+# below it the thread hand-off costs more than the scan
+_OFFLOAD_MIN_ELEMENTS = 1_000_000
+
 
 @dataclass
 class SearchResult:
@@ -22,74 +39,177 @@ class SearchService:
     def __init__(self, llm_provider: LLMProvider):
         self.llm_provider = llm_provider
         self.search_index_repo = SQLiteSearchIndexRepository()
+        # Query embeddings keyed on the normalized query; lives as long as the service
+        self._embedding_cache: TTLCache = TTLCache(
+            maxsize=settings.query_embedding_cache_size,
+            ttl=settings.query_embedding_cache_ttl,
+        )
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        # Normalised (N, D) embedding matrix, reloaded when the index version changes
+        self._entries: list[tuple[str, str, str, str]] = []  # type, id, name, snippet
+        self._matrix: np.ndarray | None = None
+        # int8 codes + per-row scales of the matrix, for the SimSIMD candidate scan
+        self._quantized: tuple[np.ndarray, np.ndarray] | None = None
+        self._index_version: tuple[int, str | None] | None = None
+        self._matrix_lock = asyncio.Lock()
+        # Results of near-duplicate queries, scoped to (index version, limit) so any
+        # index change retires them; a few scopes cover the current version's limits
+        self._result_cache: SemanticCache[list[SearchResult]] = SemanticCache(
+            settings.search_cache_threshold, maxsize=8, max_per_scope=settings.search_cache_size
+        )
     
-    def _cosine_similarity(
-        self, vec1: list[float], vec2: list[float]
-    ) -> float:
-        """Compute cosine similarity between two vectors."""
-        vec1_arr = np.array(vec1)
-        vec2_arr = np.array(vec2)
-        
-        dot_product = np.dot(vec1_arr, vec2_arr)
-        norm1 = np.linalg.norm(vec1_arr)
-        norm2 = np.linalg.norm(vec2_arr)
-        
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        
-        return float(dot_product / (norm1 * norm2))
+    async def check_index(self) -> None:
+        """Quarantine stored rows that break the uniform-embedding invariant (run at startup)."""
+        quarantined = await self.search_index_repo.quarantine_invalid_entries()
+        if quarantined:
+            logger.warning(
+                f"Moved {quarantined} search index entries with malformed embeddings "
+                "to search_index_bad"
+            )
+    
+    async def _get_query_embedding(self, query: str) -> np.ndarray:
+        """Embed a query, reusing cached and in-flight embeddings for the same text."""
+        cached = self._embedding_cache.get(query.strip().lower())
+        if cached is not None:
+            return cached
+        return await self._embed_query(query.strip())
+    
+    @single_flight
+    async def _embed_query(self, text: str) -> np.ndarray:
+        """Embed the query text as typed and cache it under the normalized query."""
+        embedding = np.asarray(await self.llm_provider.get_embedding(text), dtype=np.float32)
+        # Shared across requests via the cache, so guard against in-place edits
+        embedding.flags.writeable = False
+        self._embedding_cache[text.lower()] = embedding
+        return embedding
+    
+    @staticmethod
+    def _quantize(matrix: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Symmetric per-row int8 quantisation: row ~= codes * scale."""
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        codes = np.round(matrix / scales[:, np.newaxis]).astype(np.int8)
+        return codes, scales.astype(np.float32)
+    
+    async def _ensure_matrix(self) -> None:
+        """(Re)load the normalised index matrix if the search index has changed."""
+        version = await self.search_index_repo.get_version()
+        if version == self._index_version:
+            return
+        async with self._matrix_lock:
+            if version == self._index_version:
+                return
+            total = await self.search_index_repo.count_entries()
+            
+            # Row i of the matrix scores self._entries[i]; rows are filled as they stream in
+            kept: list[tuple[str, str, str, str]] = []
+            matrix: np.ndarray | None = None
+            async for entity_type, entity_id, name, snippet, vector in (
+                self.search_index_repo.iter_entries()
+            ):
+                # Rows were validated on write (and at startup), so all share one size
+                if matrix is None:
+                    matrix = np.empty((max(total, 1), vector.shape[0]), dtype=np.float32)
+                if len(kept) == matrix.shape[0]:
+                    # Rows upserted after the count was taken
+                    matrix = np.concatenate([matrix, np.empty_like(matrix)])
+                matrix[len(kept)] = vector
+                kept.append((entity_type, entity_id, name, snippet))
+            
+            if matrix is not None:
+                matrix = matrix[:len(kept)]
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                norms[norms == 0] = 1.0
+                matrix /= norms
+            quantized = None
+            if matrix is not None and simsimd is not None:
+                quantized = self._quantize(matrix)
+            self._entries, self._matrix, self._quantized = kept, matrix, quantized
+            self._index_version = version
+    
+    @classmethod
+    def _score_and_top_k(
+        cls,
+        query_unit: np.ndarray,
+        matrix: np.ndarray,
+        quantized: tuple[np.ndarray, np.ndarray] | None,
+        limit: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Row indices of the best `limit` matches, best first, and their cosines."""
+        shortlist = limit * _RERANK_FACTOR
+        if quantized is not None and shortlist < len(matrix):
+            # int8 dot products (VNNI via SimSIMD) shortlist candidates over a
+            # quarter of the memory traffic; only those are rescored exactly
+            codes, scales = quantized
+            query_codes, _ = cls._quantize(query_unit[np.newaxis, :])
+            approx = np.asarray(
+                simsimd.cdist(query_codes, codes, metric="dot")
+            ).ravel() * scales
+            candidates = np.argpartition(-approx, shortlist)[:shortlist]
+            candidate_scores = matrix[candidates] @ query_unit
+            order = np.argsort(-candidate_scores)[:limit]
+            top, similarities = candidates[order], candidate_scores[order]
+        else:
+            # One matrix-vector product scores every entry (cosine: rows are unit length)
+            scores = matrix @ query_unit
+            if limit < len(scores):
+                top = np.argpartition(-scores, limit)[:limit]
+                top = top[np.argsort(-scores[top])]
+            else:
+                top = np.argsort(-scores)
+            similarities = scores[top]
+        return top, similarities
     
     async def semantic_search(
-        self, query: str, limit: int = 10
+        self, query: str, limit: int = 10, no_cache: bool = False
     ) -> list[SearchResult]:
-        """Perform semantic search across characters, locations, and episodes."""
+        """Perform semantic search across characters, locations, and episodes.
+        
+        Results are reused for queries whose embedding is near-identical to an earlier
+        one against the same index version, unless no_cache is set.
+        """
         try:
             # Get embedding for query
-            query_embedding = await self.llm_provider.get_embedding(query)
+            query_embedding = await self._get_query_embedding(query)
             
-            # Get all entries from search index
-            entries = await self.search_index_repo.get_all_entries()
-            
-            if not entries:
+            await self._ensure_matrix()
+            entries, matrix, quantized = self._entries, self._matrix, self._quantized
+            if matrix is None:
                 logger.warning("Search index is empty. No results available.")
                 return []
             
-            # Compute similarity for each entry
-            results = []
-            for entry in entries:
-                try:
-                    similarity = self._cosine_similarity(
-                        query_embedding, entry["embedding_vector"]
-                    )
-                    
-                    # Extract snippet (first ~200 chars of text_blob)
-                    snippet = entry["text_blob"][:200]
-                    if len(entry["text_blob"]) > 200:
-                        snippet += "..."
-                    
-                    # Extract name from text_blob (first line usually contains name)
-                    name = entry["text_blob"].split("\n")[0]
-                    if ":" in name:
-                        name = name.split(":", 1)[1].strip()
-                    
-                    results.append(
-                        SearchResult(
-                            entity_type=entry["entity_type"],
-                            entity_id=entry["entity_id"],
-                            name=name,
-                            snippet=snippet,
-                            similarity=similarity,
-                        )
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Error processing entry {entry['entity_type']}/{entry['entity_id']}: {e}"
-                    )
-                    continue
+            scope = (self._index_version, limit)
+            if not no_cache:
+                cached = self._result_cache.lookup("search", scope, query_embedding)
+                if cached is not None:
+                    return cached
+            
+            query_norm = np.linalg.norm(query_embedding)
+            if query_norm == 0 or query_embedding.shape[0] != matrix.shape[1]:
+                return []
+            query_unit = query_embedding / query_norm
+            
+            if matrix.size >= _OFFLOAD_MIN_ELEMENTS:
+                # NumPy and SimSIMD release the GIL, so big scans run beside the loop
+                top, similarities = await asyncio.to_thread(
+                    self._score_and_top_k, query_unit, matrix, quantized, limit
+                )
+            else:
+                top, similarities = self._score_and_top_k(query_unit, matrix, quantized, limit)
             
-            # Sort by similarity (descending) and return top results
-            results.sort(key=lambda x: x.similarity, reverse=True)
-            return results[:limit]
+            results = [
+                SearchResult(
+                    entity_type=entries[i][0],
+                    entity_id=entries[i][1],
+                    name=entries[i][2],
+                    snippet=entries[i][3],
+                    similarity=float(similarity),
+                )
+                for i, similarity in zip(top, similarities)
+            ]
+            if not no_cache:
+                self._result_cache.store("search", scope, query_embedding, results)
+            return results
             
         except Exception as e:
             logger.error(f"Error in semantic search: {e}")
@@ -0,0 +1,69 @@
+"""Semantic cache of generated content and search results, matched on embeddings."""
+import hashlib
+import json
+from typing import Any, Generic, TypeVar
+import numpy as np
+from cachetools import LRUCache
+
+T = TypeVar("T")
+
+
+def context_digest(context: dict[str, Any]) -> str:
+    """SHA-256 of the canonical (key-sorted) JSON form of a generation context."""
+    canonical = json.dumps(context, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class SemanticCache(Generic[T]):
+    """Reuse a value whose key embedding is near-identical to a new one.
+    
+    Entries are scoped to a (prompt_type, scope) pair - e.g. the two characters of a
+    dialogue - so content is only ever reused for the same subjects. With
+    max_per_scope set, a scope keeps only its most recently stored entries.
+    """
+    
+    def __init__(self, threshold: float, maxsize: int, max_per_scope: int | None = None):
+        self.threshold = threshold
+        self.max_per_scope = max_per_scope
+        # scope -> (unit embeddings matrix, contents row-aligned)
+        self._entries: LRUCache = LRUCache(maxsize=maxsize)
+    
+    @staticmethod
+    def _unit(embedding: np.ndarray) -> np.ndarray | None:
+        """Return the L2-normalised embedding, or None for a zero vector."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+    
+    def lookup(
+        self, prompt_type: str, scope: tuple, embedding: np.ndarray
+    ) -> T | None:
+        """Return the closest cached content at or above the similarity threshold."""
+        entry = self._entries.get((prompt_type, scope))
+        query = self._unit(embedding)
+        if entry is None or query is None:
+            return None
+        matrix, contents = entry
+        if matrix.shape[1] != query.shape[0]:
+            return None
+        scores = matrix @ query
+        best = int(np.argmax(scores))
+        return contents[best] if scores[best] >= self.threshold else None
+    
+    def store(
+        self, prompt_type: str, scope: tuple, embedding: np.ndarray, content: T
+    ) -> None:
+        """Remember content under its context embedding."""
+        vector = self._unit(embedding)
+        if vector is None:
+            return
+        key = (prompt_type, scope)
+        entry = self._entries.get(key)
+        if entry is None or entry[0].shape[1] != vector.shape[0]:
+            self._entries[key] = (vector[np.newaxis, :], [content])
+            return
+        matrix, contents = entry
+        matrix, contents = np.vstack([matrix, vector]), contents + [content]
+        if self.max_per_scope is not None and len(contents) > self.max_per_scope:
+            matrix, contents = matrix[-self.max_per_scope:], contents[-self.max_per_scope:]
+        self._entries[key] = (matrix, contents)
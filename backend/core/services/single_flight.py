@@ -0,0 +1,37 @@
+"""Collapse concurrent identical service calls into one."""
+import asyncio
+import functools
+from typing import Any, Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def single_flight(
+    func: Callable[..., Awaitable[T]]
+) -> Callable[..., Awaitable[T]]:
+    """Share one in-progress call among concurrent callers with the same arguments.
+
+    The call runs in its own task, tracked in `self._inflight` under (method, *args),
+    and every caller awaits it through a shield: a caller that is cancelled leaves
+    the call running for the others. A failure is raised to every waiting caller;
+    nothing is kept once the call finishes.
+    """
+    @functools.wraps(func)
+    async def wrapper(self: Any, *args: Any) -> T:
+        key = (func.__name__, *args)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(self, *args))
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(_finished, self._inflight, key))
+        return await asyncio.shield(task)
+
+    return wrapper
+
+
+def _finished(inflight: dict, key: tuple, task: asyncio.Task) -> None:
+    """Forget a finished call, marking a failure retrieved in case nobody awaited it."""
+    if inflight.get(key) is task:
+        del inflight[key]
+    if not task.cancelled():
+        task.exception()
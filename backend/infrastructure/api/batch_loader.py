@@ -0,0 +1,70 @@
+"""Coalescing of concurrent single-id lookups into batched upstream requests."""
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """Collect `load(key)` calls made within a short window and fetch them together.
+    
+    `fetch_many` receives the distinct keys of one batch and returns what it found,
+    keyed the same way; keys it leaves out resolve to None. A failed fetch is raised
+    to every caller in the batch.
+    """
+    
+    def __init__(
+        self,
+        fetch_many: Callable[[list[K]], Awaitable[dict[K, V]]],
+        window: float = 0.005,
+        max_batch: int = 100,
+    ):
+        self._fetch_many = fetch_many
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: dict[K, asyncio.Future] = {}
+        self._timer: asyncio.TimerHandle | None = None
+        # Strong references to running batches, so they aren't collected mid-flight
+        self._running: set[asyncio.Task] = set()
+    
+    async def load(self, key: K) -> V | None:
+        """Return the value for `key`, fetched along with any concurrent loads."""
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self._max_batch:
+                self._dispatch()
+            elif self._timer is None:
+                self._timer = loop.call_later(self._window, self._dispatch)
+        # Shielded so one cancelled caller doesn't cancel the result for the batch
+        return await asyncio.shield(future)
+    
+    def _dispatch(self) -> None:
+        """Start fetching everything queued so far."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        task = asyncio.create_task(self._run(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+    
+    async def _run(self, batch: dict[K, asyncio.Future]) -> None:
+        """Fetch one batch and resolve its futures."""
+        try:
+            found = await self._fetch_many(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except Exception as e:
+            for future in batch.values():
+                future.set_exception(e)
+                # Mark retrieved so a batch nobody awaits anymore doesn't warn at GC time
+                future.exception()
+            return
+        for key, future in batch.items():
+            future.set_result(found.get(key))
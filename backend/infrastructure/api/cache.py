@@ -0,0 +1,53 @@
+"""Per-process response cache for Rick & Morty API clients."""
+import functools
+from typing import Any, Awaitable, Callable, Iterable, TypeVar
+from cachetools import TTLCache
+from core.services.single_flight import single_flight
+from shared.config import settings
+
+T = TypeVar("T")
+
+# Upper bound on concurrent page requests when a client walks a whole collection
+PAGE_CONCURRENCY = 10
+
+
+def new_response_cache() -> TTLCache:
+    """Create the TTL cache a client instance keeps its responses in."""
+    return TTLCache(maxsize=settings.api_cache_size, ttl=settings.api_cache_ttl)
+
+
+def cached_response(
+    func: Callable[[Any, int], Awaitable[T]]
+) -> Callable[[Any, int], Awaitable[T]]:
+    """Cache a single-argument client method in `self._cache`, keyed by (method, arg).
+
+    Only successful results are stored, so a not-found or upstream error is
+    retried on the next call. Concurrent misses for one key share a single
+    upstream call (tracked in `self._inflight`). Cached objects are returned as
+    shared references and must not be mutated by callers.
+    """
+    fetch = single_flight(func)
+    
+    @functools.wraps(func)
+    async def wrapper(self: Any, arg: int) -> T:
+        key = (func.__name__, arg)
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+        value = await fetch(self, arg)
+        self._cache[key] = value
+        return value
+    
+    return wrapper
+
+
+def mark_known(cache: TTLCache, kind: str, ids: Iterable[int]) -> None:
+    """Record ids upstream just returned, so existence checks can skip a fetch."""
+    for item_id in ids:
+        cache[("known", kind, item_id)] = True
+
+
+def is_known(cache: TTLCache, kind: str, item_id: int) -> bool:
+    """Whether `item_id` was seen in a recent response (listing or detail fetch)."""
+    return ("known", kind, item_id) in cache or (f"get_{kind}", item_id) in cache
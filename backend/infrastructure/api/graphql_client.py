@@ -1,32 +1,349 @@
 """GraphQL client for Rick & Morty API."""
-from gql import gql, Client  # type: ignore[import-untyped]
-from gql.transport.aiohttp import AIOHTTPTransport  # type: ignore[import-untyped]
+import asyncio
+import aiohttp
+import orjson
 from typing import Any
 from core.models import Character, Location, Episode
 from core.ports import RickAndMortyClient
+from infrastructure.api.batch_loader import BatchLoader
+from infrastructure.api.cache import (
+    PAGE_CONCURRENCY,
+    cached_response,
+    is_known,
+    mark_known,
+    new_response_cache,
+)
 from shared.logging import logger
 
 
+class GraphQLQueryError(Exception):
+    """The GraphQL endpoint answered with an `errors` list."""
+
+
+def _query(source: str) -> str:
+    """Collapse a query document's whitespace once, at import; the text is sent as-is."""
+    return " ".join(source.split())
+
+
+# Query documents are prepared once at import; each call only adds variables
+_GET_ALL_LOCATIONS_QUERY = _query("""
+    query GetAllLocations($page: Int) {
+        locations(page: $page) {
+            info {
+                pages
+                next
+            }
+            results {
+                id
+                name
+                type
+                dimension
+                residents {
+                    id
+                }
+            }
+        }
+    }
+""")
+
+_GET_LOCATIONS_PAGE_QUERY = _query("""
+    query GetLocationsPage($page: Int) {
+        locations(page: $page) {
+            info {
+                pages
+                count
+                next
+            }
+            results {
+                id
+                name
+                type
+                dimension
+                residents {
+                    id
+                }
+            }
+        }
+    }
+""")
+
+_GET_LOCATION_QUERY = _query("""
+    query GetLocation($id: ID!) {
+        location(id: $id) {
+            id
+            name
+            type
+            dimension
+            residents {
+                id
+                name
+                status
+                species
+                type
+                gender
+                origin {
+                    name
+                    id
+                }
+                location {
+                    name
+                    id
+                }
+                image
+                episode {
+                    episode
+                }
+                created
+            }
+        }
+    }
+""")
+
+_GET_CHARACTERS_QUERY = _query("""
+    query GetCharacters($ids: [ID!]!) {
+        charactersByIds(ids: $ids) {
+            id
+            name
+            status
+            species
+            type
+            gender
+            origin {
+                name
+                id
+            }
+            location {
+                name
+                id
+            }
+            image
+            episode {
+                id
+                name
+                air_date
+                episode
+            }
+            created
+        }
+    }
+""")
+
+_GET_ALL_CHARACTERS_QUERY = _query("""
+    query GetAllCharacters($page: Int) {
+        characters(page: $page) {
+            info {
+                pages
+                next
+            }
+            results {
+                id
+                name
+                status
+                species
+                type
+                gender
+                origin {
+                    name
+                    id
+                }
+                location {
+                    name
+                    id
+                }
+                image
+                episode {
+                    episode
+                }
+                created
+            }
+        }
+    }
+""")
+
+_GET_CHARACTERS_PAGE_QUERY = _query("""
+    query GetCharactersPage($page: Int) {
+        characters(page: $page) {
+            info {
+                pages
+                count
+                next
+            }
+            results {
+                id
+                name
+                status
+                species
+                type
+                gender
+                origin {
+                    name
+                    id
+                }
+                location {
+                    name
+                    id
+                }
+                image
+                episode {
+                    episode
+                }
+                created
+            }
+        }
+    }
+""")
+
+_GET_ALL_EPISODES_QUERY = _query("""
+    query GetAllEpisodes($page: Int) {
+        episodes(page: $page) {
+            info {
+                pages
+                next
+            }
+            results {
+                id
+                name
+                air_date
+                episode
+                characters {
+                    id
+                }
+            }
+        }
+    }
+""")
+
+_GET_EPISODES_PAGE_QUERY = _query("""
+    query GetEpisodesPage($page: Int) {
+        episodes(page: $page) {
+            info {
+                pages
+                count
+                next
+            }
+            results {
+                id
+                name
+                air_date
+                episode
+                characters {
+                    id
+                }
+            }
+        }
+    }
+""")
+
+# Episodes with their full characters, for batched single-episode lookups
+_GET_EPISODES_WITH_CHARACTERS_QUERY = _query("""
+    query GetEpisodesWithCharacters($ids: [ID!]!) {
+        episodesByIds(ids: $ids) {
+            id
+            name
+            air_date
+            episode
+            characters {
+                id
+                name
+                status
+                species
+                type
+                gender
+                origin {
+                    name
+                    id
+                }
+                location {
+                    name
+                    id
+                }
+                image
+                episode {
+                    episode
+                }
+                created
+            }
+        }
+    }
+""")
+
+_GET_EPISODES_QUERY = _query("""
+    query GetEpisodes($ids: [ID!]!) {
+        episodesByIds(ids: $ids) {
+            id
+            name
+            air_date
+            episode
+            characters {
+                id
+            }
+        }
+    }
+""")
+
+
 class RickAndMortyGraphQLClient(RickAndMortyClient):
     """GraphQL client for Rick & Morty API."""
     
     def __init__(self):
-        # Store the transport URL - we'll create a new transport for each request
-        # to avoid "Transport is already connected" errors
         self.graphql_url = "https://rickandmortyapi.com/graphql"
+        # One long-lived session keeps the aiohttp connection pool (and TLS
+        # sessions) warm across requests; created lazily inside the event loop
+        self._session: aiohttp.ClientSession | None = None
+        self._cache = new_response_cache()
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        # Concurrent single-id lookups go upstream as one by-ids query
+        self._character_loader: BatchLoader[int, Character] = BatchLoader(self._load_characters)
+        self._episode_loader: BatchLoader[int, Episode] = BatchLoader(self._load_episodes)
     
-    async def _execute_query(self, query: Any, variable_values: dict[str, Any] = None) -> dict[str, Any]:
-        """Execute a GraphQL query with a fresh client to avoid connection reuse issues."""
-        # Create a new transport and client for each request
-        # This avoids "Transport is already connected" errors
-        transport = AIOHTTPTransport(url=self.graphql_url)
-        client = Client(transport=transport, fetch_schema_from_transport=False)
-        # Use async context manager to properly handle connection lifecycle
-        async with client as session:
-            # Set variable_values on the query object
-            query.variable_values = variable_values or {}
-            result = await session.execute(query)
-            return result
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Create the shared HTTP session once and reuse it."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(headers={"Content-Type": "application/json"})
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the shared session (called on application shutdown)."""
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
+    
+    async def _execute_query(self, query: str, variable_values: dict[str, Any] | None = None) -> dict[str, Any]:
+        """POST a prepared GraphQL query and return its `data`."""
+        body = orjson.dumps({"query": query, "variables": variable_values or {}})
+        async with self._get_session().post(self.graphql_url, data=body) as response:
+            response.raise_for_status()
+            # orjson decodes the (up to ~100 KB) page payloads several times faster
+            payload = orjson.loads(await response.read())
+        if payload.get("errors"):
+            raise GraphQLQueryError(payload["errors"])
+        return payload["data"]
+    
+    async def _fetch_all_pages(self, query: str, field: str) -> list[dict[str, Any]]:
+        """Fetch every page of a paginated query: page 1 first, then the rest concurrently."""
+        try:
+            first = (await self._execute_query(query, variable_values={"page": 1}))[field]
+        except Exception as e:
+            logger.error(f"GraphQL error fetching {field} page 1: {e}")
+            raise
+        all_results = list(first["results"])
+        pages = first["info"].get("pages") or 1
+        
+        semaphore = asyncio.Semaphore(PAGE_CONCURRENCY)
+        
+        async def fetch(page: int) -> list[dict[str, Any]]:
+            async with semaphore:
+                result = await self._execute_query(query, variable_values={"page": page})
+            return result[field]["results"]
+        
+        rest = await asyncio.gather(*(fetch(p) for p in range(2, pages + 1)), return_exceptions=True)
+        for page, results in zip(range(2, pages + 1), rest):
+            if isinstance(results, Exception):
+                # As with a serial walk, keep the pages before the first failure
+                logger.error(f"GraphQL error fetching {field} page {page}: {results}")
+                break
+            all_results.extend(results)
+        return all_results
     
     def _parse_character(self, data: dict[str, Any]) -> Character:
         """Parse GraphQL character data to Character model."""
@@ -110,6 +427,7 @@ class RickAndMortyGraphQLClient(RickAndMortyClient):
             type=data["type"],
             dimension=data["dimension"],
             residents=[],  # Will be populated separately
+            resident_count=len(data.get("residents") or []),
         )
     
     def _parse_episode(self, data: dict[str, Any]) -> Episode:
@@ -157,142 +475,44 @@ class RickAndMortyGraphQLClient(RickAndMortyClient):
             characters_data=characters_data,
             url=f"https://rickandmortyapi.com/api/episode/{data['id']}",
             created=data.get("created", ""),
+            character_count=len(character_ids),
         )
     
     async def get_locations(self) -> list[Location]:
         """Fetch all locations using GraphQL (without nested residents)."""
-        all_locations = []
-        page = 1
-        
-        while True:
-            query = gql("""
-                query GetAllLocations($page: Int) {
-                    locations(page: $page) {
-                        info {
-                            pages
-                            next
-                        }
-                        results {
-                            id
-                            name
-                            type
-                            dimension
-                            residents {
-                                id
-                            }
-                        }
-                    }
-                }
-            """)
-            
-            try:
-                result = await self._execute_query(query, variable_values={"page": page})
-                locations_data = result["locations"]["results"]
-                
-                for loc_data in locations_data:
-                    location = self._parse_location(loc_data)
-                    # Calculate resident count from IDs (no full details in list query)
-                    resident_ids = loc_data.get("residents", [])
-                    # Store empty list but we know the count from the response
-                    location.residents = []  # Empty list, count calculated separately
-                    # Store count as a temporary attribute for the router to use
-                    location._resident_count = len(resident_ids)
-                    all_locations.append(location)
-                
-                # Check if there are more pages
-                info = result["locations"]["info"]
-                if not info.get("next"):
-                    break
-                page += 1
-                
-            except Exception as e:
-                logger.error(f"GraphQL error fetching locations page {page}: {e}")
-                if page == 1:
-                    raise
-                break
-        
-        return all_locations
+        locations_data = await self._fetch_all_pages(_GET_ALL_LOCATIONS_QUERY, "locations")
+        # List query selects resident ids only; _parse_location counts them
+        locations = [self._parse_location(loc_data) for loc_data in locations_data]
+        mark_known(self._cache, "location", (location.id for location in locations))
+        return locations
     
+    @cached_response
     async def get_locations_page(self, page: int) -> tuple[list[Location], int]:
         """Fetch a specific page of locations using GraphQL (without nested residents). Returns (locations, total_count)."""
-        query = gql("""
-            query GetLocationsPage($page: Int) {
-                locations(page: $page) {
-                    info {
-                        pages
-                        count
-                        next
-                    }
-                    results {
-                        id
-                        name
-                        type
-                        dimension
-                        residents {
-                            id
-                        }
-                    }
-                }
-            }
-        """)
-        
         try:
-            result = await self._execute_query(query, variable_values={"page": page})
+            result = await self._execute_query(_GET_LOCATIONS_PAGE_QUERY, variable_values={"page": page})
             locations_data = result["locations"]["results"]
             info = result["locations"]["info"]
             total_count = info.get("count", 0)
             
-            locations = []
-            for loc_data in locations_data:
-                location = self._parse_location(loc_data)
-                # Calculate resident count from IDs (no full details in list query)
-                resident_ids = loc_data.get("residents", [])
-                location.residents = []  # Empty list, count calculated separately
-                # Store count as a temporary attribute for the router to use
-                location._resident_count = len(resident_ids)
-                locations.append(location)
-            
+            # List query selects resident ids only; _parse_location counts them
+            locations = [self._parse_location(loc_data) for loc_data in locations_data]
+            mark_known(self._cache, "location", (location.id for location in locations))
             return locations, total_count
         except Exception as e:
             logger.error(f"GraphQL error fetching locations page {page}: {e}")
             raise
     
+    async def ensure_location_exists(self, location_id: int) -> None:
+        """Fail like get_location for a missing location; no request for recently seen ids."""
+        if not is_known(self._cache, "location", location_id):
+            await self.get_location(location_id)
+    
+    @cached_response
     async def get_location(self, location_id: int) -> Location:
         """Fetch a specific location by ID."""
-        query = gql("""
-            query GetLocation($id: ID!) {
-                location(id: $id) {
-                    id
-                    name
-                    type
-                    dimension
-                    residents {
-                        id
-                        name
-                        status
-                        species
-                        type
-                        gender
-                        origin {
-                            name
-                            id
-                        }
-                        location {
-                            name
-                            id
-                        }
-                        image
-                        episode {
-                            episode
-                        }
-                        created
-                    }
-                }
-            }
-        """)
-        
         try:
-            result = await self._execute_query(query, variable_values={"id": str(location_id)})
+            result = await self._execute_query(_GET_LOCATION_QUERY, variable_values={"id": str(location_id)})
             loc_data = result["location"]
             if not loc_data:
                 raise ValueError(f"Location {location_id} not found")
@@ -308,43 +528,18 @@ class RickAndMortyGraphQLClient(RickAndMortyClient):
             logger.error(f"GraphQL error fetching location {location_id}: {e}")
             raise
     
+    async def _load_characters(self, character_ids: list[int]) -> dict[int, Character]:
+        """Fetch one batch for the character loader, keyed by id."""
+        return {character.id: character for character in await self.get_characters(character_ids)}
+    
+    @cached_response
     async def get_character(self, character_id: int) -> Character:
-        """Fetch a specific character by ID."""
-        query = gql("""
-            query GetCharacter($id: ID!) {
-                character(id: $id) {
-                    id
-                    name
-                    status
-                    species
-                    type
-                    gender
-                    origin {
-                        name
-                        id
-                    }
-                    location {
-                        name
-                        id
-                    }
-                    image
-                    episode {
-                        id
-                        name
-                        air_date
-                        episode
-                    }
-                    created
-                }
-            }
-        """)
-        
+        """Fetch a specific character by ID (batched with concurrent lookups)."""
         try:
-            result = await self._execute_query(query, variable_values={"id": str(character_id)})
-            char_data = result.get("character")
-            if not char_data:
+            character = await self._character_loader.load(character_id)
+            if character is None:
                 raise ValueError(f"Character {character_id} not found")
-            return self._parse_character(char_data)
+            return character
         except Exception as e:
             logger.error(f"GraphQL error fetching character {character_id}: {e}")
             raise
@@ -354,37 +549,8 @@ class RickAndMortyGraphQLClient(RickAndMortyClient):
         if not character_ids:
             return []
         
-        query = gql("""
-            query GetCharacters($ids: [ID!]!) {
-                charactersByIds(ids: $ids) {
-                    id
-                    name
-                    status
-                    species
-                    type
-                    gender
-                    origin {
-                        name
-                        id
-                    }
-                    location {
-                        name
-                        id
-                    }
-                    image
-                    episode {
-                        id
-                        name
-                        air_date
-                        episode
-                    }
-                    created
-                }
-            }
-        """)
-        
         try:
-            result = await self._execute_query(query, variable_values={"ids": [str(cid) for cid in character_ids]})
+            result = await self._execute_query(_GET_CHARACTERS_QUERY, variable_values={"ids": [str(cid) for cid in character_ids]})
             characters_data = result.get("charactersByIds", [])
             return [self._parse_character(char) for char in characters_data if char]
         except Exception as e:
@@ -393,98 +559,14 @@ class RickAndMortyGraphQLClient(RickAndMortyClient):
     
     async def get_all_characters(self) -> list[Character]:
         """Fetch all characters using GraphQL (without nested episodes)."""
-        all_characters = []
-        page = 1
-        
-        while True:
-            query = gql("""
-                query GetAllCharacters($page: Int) {
-                    characters(page: $page) {
-                        info {
-                            pages
-                            next
-                        }
-                        results {
-                            id
-                            name
-                            status
-                            species
-                            type
-                            gender
-                            origin {
-                                name
-                                id
-                            }
-                            location {
-                                name
-                                id
-                            }
-                            image
-                            episode {
-                                episode
-                            }
-                            created
-                        }
-                    }
-                }
-            """)
-            
-            try:
-                result = await self._execute_query(query, variable_values={"page": page})
-                characters_data = result["characters"]["results"]
-                all_characters.extend([self._parse_character(char) for char in characters_data if char])
-                
-                # Check if there are more pages
-                info = result["characters"]["info"]
-                if not info.get("next"):
-                    break
-                page += 1
-                
-            except Exception as e:
-                logger.error(f"GraphQL error fetching characters page {page}: {e}")
-                if page == 1:
-                    raise
-                break
-        
-        return all_characters
+        characters_data = await self._fetch_all_pages(_GET_ALL_CHARACTERS_QUERY, "characters")
+        return [self._parse_character(char) for char in characters_data if char]
     
+    @cached_response
     async def get_characters_page(self, page: int) -> tuple[list[Character], int]:
         """Fetch a specific page of characters using GraphQL (without nested episodes). Returns (characters, total_pages)."""
-        query = gql("""
-            query GetCharactersPage($page: Int) {
-                characters(page: $page) {
-                    info {
-                        pages
-                        count
-                        next
-                    }
-                    results {
-                        id
-                        name
-                        status
-                        species
-                        type
-                        gender
-                        origin {
-                            name
-                            id
-                        }
-                        location {
-                            name
-                            id
-                        }
-                        image
-                        episode {
-                            episode
-                        }
-                        created
-                    }
-                }
-            }
-        """)
-        
         try:
-            result = await self._execute_query(query, variable_values={"page": page})
+            result = await self._execute_query(_GET_CHARACTERS_PAGE_QUERY, variable_values={"page": page})
             characters_data = result["characters"]["results"]
             info = result["characters"]["info"]
             total_pages = info.get("pages", 1)
@@ -498,137 +580,45 @@ class RickAndMortyGraphQLClient(RickAndMortyClient):
     
     async def get_episodes(self) -> list[Episode]:
         """Fetch all episodes using GraphQL (without nested characters)."""
-        all_episodes = []
-        page = 1
-        
-        while True:
-            query = gql("""
-                query GetAllEpisodes($page: Int) {
-                    episodes(page: $page) {
-                        info {
-                            pages
-                            next
-                        }
-                        results {
-                            id
-                            name
-                            air_date
-                            episode
-                            characters {
-                                id
-                            }
-                        }
-                    }
-                }
-            """)
-            
-            try:
-                result = await self._execute_query(query, variable_values={"page": page})
-                episodes_data = result["episodes"]["results"]
-                
-                for ep_data in episodes_data:
-                    episode = self._parse_episode(ep_data)
-                    # Calculate character count from IDs (no full details in list query)
-                    character_ids = ep_data.get("characters", [])
-                    episode._character_count = len(character_ids)
-                    all_episodes.append(episode)
-                
-                # Check if there are more pages
-                info = result["episodes"]["info"]
-                if not info.get("next"):
-                    break
-                page += 1
-                
-            except Exception as e:
-                logger.error(f"GraphQL error fetching episodes page {page}: {e}")
-                if page == 1:
-                    raise
-                break
-        
-        return all_episodes
+        episodes_data = await self._fetch_all_pages(_GET_ALL_EPISODES_QUERY, "episodes")
+        return [self._parse_episode(ep_data) for ep_data in episodes_data]
     
+    @cached_response
     async def get_episodes_page(self, page: int) -> tuple[list[Episode], int]:
         """Fetch a specific page of episodes using GraphQL (without nested characters). Returns (episodes, total_count)."""
-        query = gql("""
-            query GetEpisodesPage($page: Int) {
-                episodes(page: $page) {
-                    info {
-                        pages
-                        count
-                        next
-                    }
-                    results {
-                        id
-                        name
-                        air_date
-                        episode
-                        characters {
-                            id
-                        }
-                    }
-                }
-            }
-        """)
-        
         try:
-            result = await self._execute_query(query, variable_values={"page": page})
+            result = await self._execute_query(_GET_EPISODES_PAGE_QUERY, variable_values={"page": page})
             episodes_data = result["episodes"]["results"]
             info = result["episodes"]["info"]
             total_count = info.get("count", 0)
             
-            episodes = []
-            for ep_data in episodes_data:
-                episode = self._parse_episode(ep_data)
-                # Calculate character count from IDs (no full details in list query)
-                character_ids = ep_data.get("characters", [])
-                episode._character_count = len(character_ids)
-                episodes.append(episode)
-            
+            episodes = [self._parse_episode(ep_data) for ep_data in episodes_data]
             return episodes, total_count
         except Exception as e:
             logger.error(f"GraphQL error fetching episodes page {page}: {e}")
             raise
     
+    async def _load_episodes(self, episode_ids: list[int]) -> dict[int, Episode]:
+        """Fetch one batch, with full characters, for the episode loader, keyed by id."""
+        try:
+            result = await self._execute_query(
+                _GET_EPISODES_WITH_CHARACTERS_QUERY,
+                variable_values={"ids": [str(eid) for eid in episode_ids]},
+            )
+        except Exception as e:
+            logger.error(f"GraphQL error fetching episodes: {e}")
+            raise
+        episodes = (self._parse_episode(ep) for ep in result.get("episodesByIds", []) if ep)
+        return {episode.id: episode for episode in episodes}
+    
+    @cached_response
     async def get_episode(self, episode_id: int) -> Episode:
-        """Fetch a specific episode by ID."""
-        query = gql("""
-            query GetEpisode($id: ID!) {
-                episode(id: $id) {
-                    id
-                    name
-                    air_date
-                    episode
-                    characters {
-                        id
-                        name
-                        status
-                        species
-                        type
-                        gender
-                        origin {
-                            name
-                            id
-                        }
-                        location {
-                            name
-                            id
-                        }
-                        image
-                        episode {
-                            episode
-                        }
-                        created
-                    }
-                }
-            }
-        """)
-        
+        """Fetch a specific episode by ID (batched with concurrent lookups)."""
         try:
-            result = await self._execute_query(query, variable_values={"id": str(episode_id)})
-            ep_data = result.get("episode")
-            if not ep_data:
+            episode = await self._episode_loader.load(episode_id)
+            if episode is None:
                 raise ValueError(f"Episode {episode_id} not found")
-            return self._parse_episode(ep_data)
+            return episode
         except Exception as e:
             logger.error(f"GraphQL error fetching episode {episode_id}: {e}")
             raise
@@ -638,22 +628,8 @@ class RickAndMortyGraphQLClient(RickAndMortyClient):
         if not episode_ids:
             return []
         
-        query = gql("""
-            query GetEpisodes($ids: [ID!]!) {
-                episodesByIds(ids: $ids) {
-                    id
-                    name
-                    air_date
-                    episode
-                    characters {
-                        id
-                    }
-                }
-            }
-        """)
-        
         try:
-            result = await self._execute_query(query, variable_values={"ids": [str(eid) for eid in episode_ids]})
+            result = await self._execute_query(_GET_EPISODES_QUERY, variable_values={"ids": [str(eid) for eid in episode_ids]})
             episodes_data = result.get("episodesByIds", [])
             return [self._parse_episode(ep) for ep in episodes_data if ep]
         except Exception as e:
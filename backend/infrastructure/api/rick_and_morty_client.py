@@ -1,40 +1,91 @@
 """Rick & Morty API client implementation."""
+import asyncio
 import httpx
-from typing import Any
+import orjson
+from typing import Any, Awaitable, Callable, TypeVar
 from core.models import Character, Location, Episode
 from core.ports import RickAndMortyClient
+from core.resource_ids import parse_resource_ids
+from infrastructure.api.cache import (
+    PAGE_CONCURRENCY,
+    cached_response,
+    is_known,
+    mark_known,
+    new_response_cache,
+)
 from shared.config import settings
 from shared.logging import logger
 
+T = TypeVar("T")
+
+# Upper bound on concurrent per-item requests when a batch endpoint fails
+_FAN_OUT_CONCURRENCY = 16
+
 
 class RickAndMortyRESTClient(RickAndMortyClient):
     """HTTP client for Rick & Morty API."""
     
     def __init__(self):
         self.base_url = settings.rick_and_morty_api_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        )
+        self._cache = new_response_cache()
+        self._inflight: dict[tuple, asyncio.Task] = {}
+    
+    async def close(self) -> None:
+        """Close the pooled HTTP client (called on application shutdown)."""
+        await self.client.aclose()
+    
+    async def _fetch_each(
+        self, fetch: Callable[[int], Awaitable[T]], ids: list[int], kind: str
+    ) -> list[T]:
+        """Fetch items one by one, concurrently but bounded, skipping failures."""
+        semaphore = asyncio.Semaphore(_FAN_OUT_CONCURRENCY)
+        
+        async def fetch_one(item_id: int) -> T | None:
+            async with semaphore:
+                try:
+                    return await fetch(item_id)
+                except Exception as e:
+                    logger.warning(f"Failed to fetch {kind} {item_id}: {e}")
+                    return None
+        
+        results = await asyncio.gather(*(fetch_one(item_id) for item_id in ids))
+        return [item for item in results if item is not None]
     
     async def _fetch_all_pages(self, endpoint: str) -> list[dict[str, Any]]:
-        """Fetch all pages from a paginated endpoint."""
-        all_results = []
+        """Fetch all pages from a paginated endpoint: page 1 first, then the rest concurrently."""
         url = f"{self.base_url}/{endpoint}"
+        try:
+            response = await self.client.get(url)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+        except httpx.HTTPError as e:
+            logger.error(f"Error fetching {url}: {e}")
+            return []
         
-        while url:
-            try:
-                response = await self.client.get(url)
-                response.raise_for_status()
-                data = response.json()
-                
-                if "results" in data:
-                    all_results.extend(data["results"])
-                else:
-                    all_results.append(data)
-                
-                url = data.get("info", {}).get("next")
-            except httpx.HTTPError as e:
-                logger.error(f"Error fetching {url}: {e}")
-                break
+        if "results" not in data:
+            return [data]
+        all_results = list(data["results"])
+        pages = data.get("info", {}).get("pages") or 1
+        
+        semaphore = asyncio.Semaphore(PAGE_CONCURRENCY)
         
+        async def fetch(page: int) -> list[dict[str, Any]]:
+            async with semaphore:
+                results, _ = await self._fetch_page(endpoint, page)
+            return results
+        
+        rest = await asyncio.gather(*(fetch(p) for p in range(2, pages + 1)), return_exceptions=True)
+        for results in rest:
+            if isinstance(results, httpx.HTTPError):
+                # Logged by _fetch_page; as with a serial walk, keep the pages before it
+                break
+            if isinstance(results, BaseException):
+                raise results
+            all_results.extend(results)
         return all_results
     
     def _parse_character(self, data: dict[str, Any]) -> Character:
@@ -62,30 +113,71 @@ class RickAndMortyRESTClient(RickAndMortyClient):
             type=location_data["type"],
             dimension=location_data["dimension"],
             residents=[],  # Will be populated separately
+            resident_count=len(location_data.get("residents") or []),
         )
     
     async def get_locations(self) -> list[Location]:
         """Fetch all locations."""
         locations_data = await self._fetch_all_pages("location")
         locations = [self._parse_location(loc) for loc in locations_data]
+        mark_known(self._cache, "location", (location.id for location in locations))
         
-        # Fetch residents for each location
-        for location in locations:
-            location_data = next(
-                (loc for loc in locations_data if loc["id"] == location.id),
-                None
-            )
-            if location_data and location_data.get("residents"):
-                resident_urls = location_data["residents"]
-                character_ids = [
-                    int(url.split("/")[-1]) for url in resident_urls
-                ]
-                if character_ids:
-                    characters = await self.get_characters(character_ids)
-                    location.residents = characters
+        # Fetch residents for each location (one batch request per location, concurrently)
+        semaphore = asyncio.Semaphore(_FAN_OUT_CONCURRENCY)
+        
+        async def load_residents(location: Location, location_data: dict[str, Any]) -> None:
+            character_ids = parse_resource_ids(location_data.get("residents") or [])
+            if character_ids:
+                async with semaphore:
+                    location.residents = await self.get_characters(character_ids)
+        
+        await asyncio.gather(*(
+            load_residents(location, location_data)
+            for location, location_data in zip(locations, locations_data)
+        ))
         
         return locations
     
+    async def _fetch_page(self, endpoint: str, page: int) -> tuple[list[dict[str, Any]], int]:
+        """Fetch one page of a paginated endpoint. Returns (results, total_count)."""
+        try:
+            response = await self.client.get(
+                f"{self.base_url}/{endpoint}", params={"page": page}
+            )
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            return data.get("results", []), data.get("info", {}).get("count", 0)
+        except httpx.HTTPError as e:
+            logger.error(f"Error fetching {endpoint} page {page}: {e}")
+            raise
+    
+    @cached_response
+    async def get_locations_page(self, page: int) -> tuple[list[Location], int]:
+        """Fetch one page of locations without residents. Returns (locations, total_count)."""
+        results, total_count = await self._fetch_page("location", page)
+        # Resident URLs are in the payload, so counts come without fetching residents
+        locations = [self._parse_location(loc) for loc in results]
+        mark_known(self._cache, "location", (location.id for location in locations))
+        return locations, total_count
+    
+    @cached_response
+    async def get_characters_page(self, page: int) -> tuple[list[Character], int]:
+        """Fetch one page of characters. Returns (characters, total_count)."""
+        results, total_count = await self._fetch_page("character", page)
+        return [self._parse_character(char) for char in results], total_count
+    
+    @cached_response
+    async def get_episodes_page(self, page: int) -> tuple[list[Episode], int]:
+        """Fetch one page of episodes. Returns (episodes, total_count)."""
+        results, total_count = await self._fetch_page("episode", page)
+        return [self._parse_episode(ep) for ep in results], total_count
+    
+    async def ensure_location_exists(self, location_id: int) -> None:
+        """Fail like get_location for a missing location; no request for recently seen ids."""
+        if not is_known(self._cache, "location", location_id):
+            await self.get_location(location_id)
+    
+    @cached_response
     async def get_location(self, location_id: int) -> Location:
         """Fetch a specific location."""
         try:
@@ -93,16 +185,13 @@ class RickAndMortyRESTClient(RickAndMortyClient):
                 f"{self.base_url}/location/{location_id}"
             )
             response.raise_for_status()
-            location_data = response.json()
+            location_data = orjson.loads(response.content)
             
             location = self._parse_location(location_data)
             
             # Fetch residents
             if location_data.get("residents"):
-                character_ids = [
-                    int(url.split("/")[-1])
-                    for url in location_data["residents"]
-                ]
+                character_ids = parse_resource_ids(location_data["residents"])
                 if character_ids:
                     characters = await self.get_characters(character_ids)
                     location.residents = characters
@@ -112,6 +201,7 @@ class RickAndMortyRESTClient(RickAndMortyClient):
             logger.error(f"Error fetching location {location_id}: {e}")
             raise
     
+    @cached_response
     async def get_character(self, character_id: int) -> Character:
         """Fetch a specific character."""
         try:
@@ -119,7 +209,7 @@ class RickAndMortyRESTClient(RickAndMortyClient):
                 f"{self.base_url}/character/{character_id}"
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             return self._parse_character(data)
         except httpx.HTTPError as e:
             logger.error(f"Error fetching character {character_id}: {e}")
@@ -141,7 +231,7 @@ class RickAndMortyRESTClient(RickAndMortyClient):
                 f"{self.base_url}/character/{ids_str}"
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # API returns list or single object
             if isinstance(data, list):
@@ -150,12 +240,7 @@ class RickAndMortyRESTClient(RickAndMortyClient):
                 characters = [self._parse_character(data)]
         except httpx.HTTPError:
             # Fallback to individual fetches
-            for char_id in character_ids:
-                try:
-                    character = await self.get_character(char_id)
-                    characters.append(character)
-                except Exception as e:
-                    logger.warning(f"Failed to fetch character {char_id}: {e}")
+            characters = await self._fetch_each(self.get_character, character_ids, "character")
         
         return characters
     
@@ -189,6 +274,7 @@ class RickAndMortyRESTClient(RickAndMortyClient):
             characters=data["characters"],
             url=data["url"],
             created=data["created"],
+            character_count=len(data["characters"]),
         )
     
     async def get_episodes(self) -> list[Episode]:
@@ -196,6 +282,7 @@ class RickAndMortyRESTClient(RickAndMortyClient):
         episodes_data = await self._fetch_all_pages("episode")
         return [self._parse_episode(ep) for ep in episodes_data]
     
+    @cached_response
     async def get_episode(self, episode_id: int) -> Episode:
         """Fetch a specific episode."""
         try:
@@ -203,7 +290,7 @@ class RickAndMortyRESTClient(RickAndMortyClient):
                 f"{self.base_url}/episode/{episode_id}"
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             return self._parse_episode(data)
         except httpx.HTTPError as e:
             logger.error(f"Error fetching episode {episode_id}: {e}")
@@ -220,7 +307,7 @@ class RickAndMortyRESTClient(RickAndMortyClient):
                 f"{self.base_url}/episode/{ids_str}"
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             if isinstance(data, list):
                 return [self._parse_episode(ep) for ep in data]
@@ -228,12 +315,5 @@ class RickAndMortyRESTClient(RickAndMortyClient):
                 return [self._parse_episode(data)]
         except httpx.HTTPError:
             # Fallback to individual fetches
-            episodes = []
-            for ep_id in episode_ids:
-                try:
-                    episode = await self.get_episode(ep_id)
-                    episodes.append(episode)
-                except Exception as e:
-                    logger.warning(f"Failed to fetch episode {ep_id}: {e}")
-            return episodes
+            return await self._fetch_each(self.get_episode, episode_ids, "episode")
 
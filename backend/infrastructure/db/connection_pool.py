@@ -0,0 +1,98 @@
+"""Pooled aiosqlite connections shared by the SQLite repositories."""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+import aiosqlite
+from shared.config import settings
+from shared.logging import logger
+
+
+# Applied to every pooled connection. WAL lets readers run concurrently with
+# the single writer; synchronous=NORMAL is safe under WAL. The generous
+# busy_timeout lets bursts of writers queue on the lock instead of failing.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA busy_timeout=30000",
+)
+
+
+class SQLiteConnectionPool:
+    """Fixed-size pool of long-lived aiosqlite connections to one database file."""
+    
+    def __init__(self, db_path: str, pool_size: int = 8):
+        self.db_path = db_path
+        self.pool_size = pool_size
+        self._idle: asyncio.Queue[aiosqlite.Connection] = asyncio.Queue()
+        self._connections: list[aiosqlite.Connection] = []
+        self._open_lock = asyncio.Lock()
+        self._opened = False
+    
+    async def _connect(self) -> aiosqlite.Connection:
+        """Open and configure a single connection."""
+        conn = await aiosqlite.connect(self.db_path)
+        conn.row_factory = aiosqlite.Row
+        for pragma in _PRAGMAS:
+            await conn.execute(pragma)
+        return conn
+    
+    async def open(self) -> None:
+        """Open all pooled connections (idempotent)."""
+        if self._opened:
+            return
+        async with self._open_lock:
+            if self._opened:
+                return
+            for _ in range(self.pool_size):
+                conn = await self._connect()
+                self._connections.append(conn)
+                self._idle.put_nowait(conn)
+            self._opened = True
+            logger.info(f"Opened SQLite pool ({self.pool_size} connections) for {self.db_path}")
+    
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a connection for the duration of the block."""
+        await self.open()
+        conn = await self._idle.get()
+        try:
+            yield conn
+        finally:
+            # Never hand a half-finished transaction to the next borrower
+            try:
+                if conn.in_transaction:
+                    await conn.rollback()
+            finally:
+                self._idle.put_nowait(conn)
+    
+    async def close(self) -> None:
+        """Close every pooled connection."""
+        async with self._open_lock:
+            while not self._idle.empty():
+                self._idle.get_nowait()
+            for conn in self._connections:
+                try:
+                    await conn.close()
+                except Exception as e:
+                    logger.warning(f"Error closing SQLite connection: {e}")
+            self._connections.clear()
+            self._opened = False
+
+
+_pools: dict[str, SQLiteConnectionPool] = {}
+
+
+def get_pool(db_path: str) -> SQLiteConnectionPool:
+    """Get the process-wide pool for a database file."""
+    pool = _pools.get(db_path)
+    if pool is None:
+        pool = SQLiteConnectionPool(db_path, settings.sqlite_pool_size)
+        _pools[db_path] = pool
+    return pool
+
+
+async def close_pools() -> None:
+    """Close all pools (called on application shutdown)."""
+    for pool in _pools.values():
+        await pool.close()
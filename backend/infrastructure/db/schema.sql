@@ -64,7 +64,7 @@ CREATE TABLE IF NOT EXISTS search_index (
     entity_type TEXT NOT NULL,    -- "character" | "location" | "episode"
     entity_id TEXT NOT NULL,       -- "1", "3", etc.
     text_blob TEXT NOT NULL,       -- canonical facts + notes + AI summary
-    embedding_vector TEXT NOT NULL, -- JSON string of float[] embedding
+    embedding_vector BLOB NOT NULL, -- float32 bytes (legacy rows: JSON float[])
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     PRIMARY KEY (entity_type, entity_id)
 );
@@ -74,4 +74,5 @@ CREATE INDEX IF NOT EXISTS idx_notes_subject ON notes(subject_type, subject_id);
 CREATE INDEX IF NOT EXISTS idx_generated_content_subject ON generated_content(subject_id, prompt_type);
 CREATE INDEX IF NOT EXISTS idx_character_embeddings_character_id ON character_embeddings(character_id);
 CREATE INDEX IF NOT EXISTS idx_search_index_entity ON search_index(entity_type, entity_id);
+CREATE INDEX IF NOT EXISTS idx_search_index_updated_at ON search_index(updated_at);
 
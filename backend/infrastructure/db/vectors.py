@@ -0,0 +1,15 @@
+"""Encoding of embedding vectors for SQLite storage."""
+import json
+import numpy as np
+
+
+def encode_vector(vector: np.ndarray) -> bytes:
+    """Encode an embedding as raw little-endian float32 bytes."""
+    return np.ascontiguousarray(vector, dtype="<f4").tobytes()
+
+
+def decode_vector(value: bytes | str) -> np.ndarray:
+    """Decode a stored embedding (float32 bytes, or legacy JSON text) to float32."""
+    if isinstance(value, (bytes, memoryview)):
+        return np.frombuffer(value, dtype="<f4")
+    return np.asarray(json.loads(value), dtype=np.float32)
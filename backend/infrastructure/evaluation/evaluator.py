@@ -6,6 +6,20 @@ from core.ports import EvaluationProvider, LLMProvider
 from shared.logging import logger
 
 
+# Static rubric for the LLM creativity judge, sent as the system prompt so the
+# per-summary text comes last and the rubric prefix is identical on every call
+_CREATIVITY_JUDGE_SYSTEM_PROMPT = (
+    "You are an expert evaluator of creative writing in the style of Rick & Morty. "
+    "Rate the creativity and narrative style of this summary on a scale of 1-5:\n\n"
+    "Scoring criteria:\n"
+    "- 1-2: Generic, boring, lacks personality\n"
+    "- 3: Somewhat engaging but missing the irreverent Rick & Morty tone\n"
+    "- 4: Good creativity and style, captures some of the show's humor\n"
+    "- 5: Excellent creativity, perfectly captures Rick & Morty's sarcastic, "
+    "irreverent, and darkly comedic tone"
+)
+
+
 class HeuristicEvaluator(EvaluationProvider):
     """Heuristic-based content evaluator with improved scoring methods."""
     
@@ -41,6 +55,16 @@ class HeuristicEvaluator(EvaluationProvider):
             relevance_score=relevance_score,
         )
     
+    def heuristic_scores(
+        self, generated_text: str, factual_context: dict
+    ) -> tuple[float, float, float]:
+        """Factual, completeness and relevance scores - the CPU-only metrics."""
+        return (
+            self._compute_factual_score(generated_text, factual_context),
+            self._compute_completeness_score(generated_text, factual_context),
+            self._compute_relevance_score(generated_text, factual_context),
+        )
+    
     def _compute_factual_score(
         self, text: str, context: dict
     ) -> float:
@@ -261,19 +285,11 @@ class HeuristicEvaluator(EvaluationProvider):
         """Score creativity using LLM with improved prompt (returns 1-5 scale, normalized to 0-1)."""
         try:
             prompt = (
-                "You are an expert evaluator of creative writing in the style of Rick & Morty. "
-                "Rate the creativity and narrative style of this summary on a scale of 1-5:\n\n"
-                "Scoring criteria:\n"
-                "- 1-2: Generic, boring, lacks personality\n"
-                "- 3: Somewhat engaging but missing the irreverent Rick & Morty tone\n"
-                "- 4: Good creativity and style, captures some of the show's humor\n"
-                "- 5: Excellent creativity, perfectly captures Rick & Morty's sarcastic, "
-                "irreverent, and darkly comedic tone\n\n"
                 f"Summary to evaluate:\n{text}\n\n"
                 "Respond with only a single number (1-5)."
             )
             
-            response = await llm_provider.generate(prompt)
+            response = await llm_provider.generate(prompt, _CREATIVITY_JUDGE_SYSTEM_PROMPT)
             
             # Extract number from response
             match = re.search(r'\b([1-5])\b', response.strip())
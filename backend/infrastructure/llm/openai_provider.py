@@ -1,4 +1,5 @@
 """OpenAI LLM provider implementation."""
+import numpy as np
 from openai import AsyncOpenAI
 from core.ports import LLMProvider
 from shared.config import settings
@@ -33,14 +34,14 @@ class OpenAIProvider(LLMProvider):
             logger.error(f"Error generating text: {e}")
             raise
     
-    async def get_embedding(self, text: str) -> list[float]:
-        """Get embedding vector for text."""
+    async def get_embedding(self, text: str) -> np.ndarray:
+        """Get embedding vector (float32) for text."""
         try:
             response = await self.client.embeddings.create(
                 model=self.embedding_model,
                 input=text,
             )
-            return response.data[0].embedding
+            return np.asarray(response.data[0].embedding, dtype=np.float32)
         except Exception as e:
             logger.error(f"Error getting embedding: {e}")
             raise
@@ -1,8 +1,8 @@
 """Character repository implementation."""
-import aiosqlite
 from datetime import datetime
 from core.models import Note
 from core.ports import CharacterRepository
+from infrastructure.db.connection_pool import get_pool
 from shared.config import settings
 from shared.logging import logger
 
@@ -14,16 +14,11 @@ class SQLiteCharacterRepository(CharacterRepository):
         self.db_path = db_path or settings.database_url.replace(
             "sqlite+aiosqlite:///", ""
         )
-    
-    async def _get_connection(self) -> aiosqlite.Connection:
-        """Get database connection."""
-        conn = await aiosqlite.connect(self.db_path)
-        conn.row_factory = aiosqlite.Row
-        return conn
+        self._pool = get_pool(self.db_path)
     
     async def get_notes(self, character_id: int) -> list[Note]:
         """Get all notes for a character."""
-        async with await self._get_connection() as conn:
+        async with self._pool.acquire() as conn:
             cursor = await conn.execute(
                 "SELECT id, character_id, note_text, created_at "
                 "FROM character_notes WHERE character_id = ? "
@@ -44,7 +39,7 @@ class SQLiteCharacterRepository(CharacterRepository):
     
     async def add_note(self, character_id: int, note_text: str) -> Note:
         """Add a note to a character."""
-        async with await self._get_connection() as conn:
+        async with self._pool.acquire() as conn:
             cursor = await conn.execute(
                 "INSERT INTO character_notes (character_id, note_text) "
                 "VALUES (?, ?)",
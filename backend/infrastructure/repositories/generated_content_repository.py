@@ -1,9 +1,9 @@
 """Generated content repository implementation."""
-import aiosqlite
 import json
 from datetime import datetime
 from core.models import GeneratedContent
 from core.ports import GeneratedContentRepository
+from infrastructure.db.connection_pool import get_pool
 from shared.config import settings
 
 
@@ -14,22 +14,19 @@ class SQLiteGeneratedContentRepository(GeneratedContentRepository):
         self.db_path = db_path or settings.database_url.replace(
             "sqlite+aiosqlite:///", ""
         )
-    
-    async def _get_connection(self) -> aiosqlite.Connection:
-        """Get database connection."""
-        conn = await aiosqlite.connect(self.db_path)
-        conn.row_factory = aiosqlite.Row
-        return conn
+        self._pool = get_pool(self.db_path)
     
     async def save(self, content: GeneratedContent) -> GeneratedContent:
         """Save generated content."""
-        conn = await self._get_connection()
-        try:
+        async with self._pool.acquire() as conn:
+            # RETURNING hands back the generated columns, so the new row is
+            # not read back; everything else is already in `content`
             cursor = await conn.execute(
                 "INSERT INTO generated_content "
                 "(subject_id, prompt_type, output_text, factual_score, "
                 "completeness_score, creativity_score, relevance_score, context_json) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+                "RETURNING id, created_at",
                 (
                     content.subject_id,
                     content.prompt_type,
@@ -41,51 +38,29 @@ class SQLiteGeneratedContentRepository(GeneratedContentRepository):
                     json.dumps(content.context_json),
                 ),
             )
-            await conn.commit()
-            
-            note_id = cursor.lastrowid
-            if note_id is None:
-                raise ValueError("Failed to save generated content")
-            
-            # Fetch the created content
-            cursor = await conn.execute(
-                "SELECT id, subject_id, prompt_type, output_text, "
-                "factual_score, completeness_score, creativity_score, relevance_score, "
-                "context_json, created_at "
-                "FROM generated_content WHERE id = ?",
-                (note_id,),
-            )
             row = await cursor.fetchone()
+            await conn.commit()
             if not row:
-                raise ValueError("Failed to fetch created content")
-            
-            # Handle relevance_score which may not exist in older rows
-            try:
-                relevance_score = row["relevance_score"] if row["relevance_score"] is not None else 0.0
-            except (KeyError, IndexError):
-                relevance_score = 0.0
+                raise ValueError("Failed to save generated content")
             
             return GeneratedContent(
                 id=row["id"],
-                subject_id=row["subject_id"],
-                prompt_type=row["prompt_type"],
-                output_text=row["output_text"],
-                factual_score=row["factual_score"],
-                completeness_score=row["completeness_score"],
-                creativity_score=row["creativity_score"],
-                relevance_score=relevance_score,
-                context_json=json.loads(row["context_json"]),
+                subject_id=content.subject_id,
+                prompt_type=content.prompt_type,
+                output_text=content.output_text,
+                factual_score=content.factual_score,
+                completeness_score=content.completeness_score,
+                creativity_score=content.creativity_score,
+                relevance_score=content.relevance_score,
+                context_json=content.context_json,
                 created_at=datetime.fromisoformat(row["created_at"]),
             )
-        finally:
-            await conn.close()
     
     async def get_by_subject(
         self, subject_id: int, prompt_type: str
     ) -> list[GeneratedContent]:
         """Get generated content for a subject."""
-        conn = await self._get_connection()
-        try:
+        async with self._pool.acquire() as conn:
             cursor = await conn.execute(
                 "SELECT id, subject_id, prompt_type, output_text, "
                 "factual_score, completeness_score, creativity_score, relevance_score, "
@@ -111,8 +86,6 @@ class SQLiteGeneratedContentRepository(GeneratedContentRepository):
                 )
                 for row in rows
             ]
-        finally:
-            await conn.close()
     
     async def get_latest_by_subject(
         self, subject_id: int, prompt_type: str
@@ -130,8 +103,7 @@ class SQLiteGeneratedContentRepository(GeneratedContentRepository):
         relevance_score: float,
     ) -> None:
         """Update evaluation scores for existing content."""
-        conn = await self._get_connection()
-        try:
+        async with self._pool.acquire() as conn:
             await conn.execute(
                 "UPDATE generated_content "
                 "SET factual_score = ?, completeness_score = ?, creativity_score = ?, relevance_score = ? "
@@ -139,6 +111,4 @@ class SQLiteGeneratedContentRepository(GeneratedContentRepository):
                 (factual_score, completeness_score, creativity_score, relevance_score, content_id),
             )
             await conn.commit()
-        finally:
-            await conn.close()
 
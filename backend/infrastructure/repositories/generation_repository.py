@@ -1,8 +1,8 @@
 """Generation repository implementation."""
-import aiosqlite
 import uuid
 from datetime import datetime
 from core.models import Generation
+from infrastructure.db.connection_pool import get_pool
 from shared.config import settings
 from shared.logging import logger
 
@@ -14,12 +14,7 @@ class SQLiteGenerationRepository:
         self.db_path = db_path or settings.database_url.replace(
             "sqlite+aiosqlite:///", ""
         )
-    
-    async def _get_connection(self) -> aiosqlite.Connection:
-        """Get database connection."""
-        conn = await aiosqlite.connect(self.db_path)
-        conn.row_factory = aiosqlite.Row
-        return conn
+        self._pool = get_pool(self.db_path)
     
     async def close(self):
         """Close connection (for context manager)."""
@@ -29,8 +24,7 @@ class SQLiteGenerationRepository:
         self, entity_type: str, entity_id: str
     ) -> Generation | None:
         """Get generation by entity type and ID."""
-        conn = await self._get_connection()
-        try:
+        async with self._pool.acquire() as conn:
             cursor = await conn.execute(
                 "SELECT generation_id, entity_type, entity_id, summary_text, "
                 "factual_score, creativity_score, completeness_score, relevance_score, "
@@ -61,8 +55,6 @@ class SQLiteGenerationRepository:
                 created_at=datetime.fromisoformat(row["created_at"]),
                 updated_at=datetime.fromisoformat(row["updated_at"]),
             )
-        finally:
-            await conn.close()
     
     async def create_initiated(
         self, entity_type: str, entity_id: str, summary_text: str
@@ -71,8 +63,7 @@ class SQLiteGenerationRepository:
         generation_id = str(uuid.uuid4())
         now = datetime.utcnow().isoformat()
         
-        conn = await self._get_connection()
-        try:
+        async with self._pool.acquire() as conn:
             await conn.execute(
                 "INSERT INTO generations "
                 "(generation_id, entity_type, entity_id, summary_text, "
@@ -108,8 +99,6 @@ class SQLiteGenerationRepository:
                 created_at=datetime.fromisoformat(now),
                 updated_at=datetime.fromisoformat(now),
             )
-        finally:
-            await conn.close()
     
     async def update_scores(
         self,
@@ -123,8 +112,7 @@ class SQLiteGenerationRepository:
         """Update scores and set status to GENERATED."""
         now = datetime.utcnow().isoformat()
         
-        conn = await self._get_connection()
-        try:
+        async with self._pool.acquire() as conn:
             await conn.execute(
                 "UPDATE generations "
                 "SET factual_score = ?, creativity_score = ?, completeness_score = ?, relevance_score = ?, "
@@ -141,6 +129,4 @@ class SQLiteGenerationRepository:
                 ),
             )
             await conn.commit()
-        finally:
-            await conn.close()
 
@@ -1,11 +1,15 @@
 """Unified note repository implementation."""
-import aiosqlite
 from datetime import datetime
 from core.models import Note
 from core.ports import NoteRepository
+from infrastructure.db.connection_pool import get_pool
 from shared.config import settings
 from shared.logging import logger
 
+# SQLite stores "YYYY-MM-DD HH:MM:SS"; swapping the separator yields exactly
+# datetime.isoformat() output without formatting each note in Python
+_CREATED_AT_ISO = "replace(created_at, ' ', 'T') AS created_at_iso"
+
 
 class SQLiteNoteRepository(NoteRepository):
     """SQLite implementation of unified note repository."""
@@ -14,19 +18,14 @@ class SQLiteNoteRepository(NoteRepository):
         self.db_path = db_path or settings.database_url.replace(
             "sqlite+aiosqlite:///", ""
         )
-    
-    async def _get_connection(self) -> aiosqlite.Connection:
-        """Get database connection."""
-        conn = await aiosqlite.connect(self.db_path)
-        conn.row_factory = aiosqlite.Row
-        return conn
+        self._pool = get_pool(self.db_path)
     
     async def get_notes(self, subject_type: str, subject_id: int) -> list[Note]:
         """Get all notes for a subject (character, location, or episode)."""
-        conn = await self._get_connection()
-        try:
+        async with self._pool.acquire() as conn:
             cursor = await conn.execute(
-                "SELECT id, subject_type, subject_id, note_text, created_at "
+                "SELECT id, subject_type, subject_id, note_text, created_at, "
+                f"{_CREATED_AT_ISO} "
                 "FROM notes WHERE subject_type = ? AND subject_id = ? "
                 "ORDER BY created_at DESC",
                 (subject_type, subject_id),
@@ -39,18 +38,16 @@ class SQLiteNoteRepository(NoteRepository):
                     subject_id=row["subject_id"],
                     note_text=row["note_text"],
                     created_at=datetime.fromisoformat(row["created_at"]),
+                    created_at_iso=row["created_at_iso"],
                 )
                 for row in rows
             ]
-        finally:
-            await conn.close()
     
     async def get_notes_paginated(
         self, subject_type: str, subject_id: int, page: int = 1, limit: int = 20
     ) -> tuple[list[Note], int]:
         """Get paginated notes for a subject, ordered by created_at DESC (latest first)."""
-        conn = await self._get_connection()
-        try:
+        async with self._pool.acquire() as conn:
             # Get total count
             cursor = await conn.execute(
                 "SELECT COUNT(*) as count "
@@ -63,7 +60,8 @@ class SQLiteNoteRepository(NoteRepository):
             # Get paginated notes (latest first)
             offset = (page - 1) * limit
             cursor = await conn.execute(
-                "SELECT id, subject_type, subject_id, note_text, created_at "
+                "SELECT id, subject_type, subject_id, note_text, created_at, "
+                f"{_CREATED_AT_ISO} "
                 "FROM notes WHERE subject_type = ? AND subject_id = ? "
                 "ORDER BY created_at DESC "
                 "LIMIT ? OFFSET ?",
@@ -77,12 +75,11 @@ class SQLiteNoteRepository(NoteRepository):
                     subject_id=row["subject_id"],
                     note_text=row["note_text"],
                     created_at=datetime.fromisoformat(row["created_at"]),
+                    created_at_iso=row["created_at_iso"],
                 )
                 for row in rows
             ]
             return notes, total
-        finally:
-            await conn.close()
     
     async def add_note(self, subject_type: str, subject_id: int, note_text: str) -> Note:
         """Add a note to a subject (character, location, or episode)."""
@@ -90,65 +87,40 @@ class SQLiteNoteRepository(NoteRepository):
         if subject_type not in ["character", "location", "episode"]:
             raise ValueError(f"Invalid subject_type: {subject_type}. Must be 'character', 'location', or 'episode'")
         
-        conn = await self._get_connection()
-        try:
-            # Try to insert, ignore if duplicate (based on unique constraint)
-            try:
-                cursor = await conn.execute(
-                    "INSERT INTO notes (subject_type, subject_id, note_text) "
-                    "VALUES (?, ?, ?)",
-                    (subject_type, subject_id, note_text),
-                )
-                await conn.commit()
-                
-                note_id = cursor.lastrowid
-                if note_id is None:
-                    raise ValueError("Failed to create note")
-                
-                # Fetch the created note
-                cursor = await conn.execute(
-                    "SELECT id, subject_type, subject_id, note_text, created_at "
-                    "FROM notes WHERE id = ?",
-                    (note_id,),
-                )
-                row = await cursor.fetchone()
-                if not row:
-                    raise ValueError("Failed to fetch created note")
-                
-                return Note(
-                    id=row["id"],
-                    subject_type=row["subject_type"],
-                    subject_id=row["subject_id"],
-                    note_text=row["note_text"],
-                    created_at=datetime.fromisoformat(row["created_at"]),
-                )
-            except aiosqlite.IntegrityError:
-                # Duplicate note - fetch existing one
-                cursor = await conn.execute(
-                    "SELECT id, subject_type, subject_id, note_text, created_at "
-                    "FROM notes WHERE subject_type = ? AND subject_id = ? AND note_text = ?",
-                    (subject_type, subject_id, note_text),
-                )
-                row = await cursor.fetchone()
-                if row:
-                    return Note(
-                        id=row["id"],
-                        subject_type=row["subject_type"],
-                        subject_id=row["subject_id"],
-                        note_text=row["note_text"],
-                        created_at=datetime.fromisoformat(row["created_at"]),
-                    )
-                raise ValueError("Failed to handle duplicate note")
-        finally:
-            await conn.close()
+        async with self._pool.acquire() as conn:
+            # One statement inserts the note, or touches the existing duplicate
+            # (unique on subject + text), and hands the row back via RETURNING.
+            await conn.execute("BEGIN IMMEDIATE")
+            cursor = await conn.execute(
+                "INSERT INTO notes (subject_type, subject_id, note_text) "
+                "VALUES (?, ?, ?) "
+                "ON CONFLICT (subject_type, subject_id, note_text) "
+                "DO UPDATE SET note_text = excluded.note_text "
+                "RETURNING id, subject_type, subject_id, note_text, created_at, "
+                f"{_CREATED_AT_ISO}",
+                (subject_type, subject_id, note_text),
+            )
+            row = await cursor.fetchone()
+            await conn.commit()
+            if not row:
+                raise ValueError("Failed to create note")
+            
+            return Note(
+                id=row["id"],
+                subject_type=row["subject_type"],
+                subject_id=row["subject_id"],
+                note_text=row["note_text"],
+                created_at=datetime.fromisoformat(row["created_at"]),
+                created_at_iso=row["created_at_iso"],
+            )
     
     async def update_note(self, note_id: int, note_text: str) -> Note:
         """Update a note by ID."""
-        conn = await self._get_connection()
-        try:
+        async with self._pool.acquire() as conn:
             # First check if note exists
             cursor = await conn.execute(
-                "SELECT id, subject_type, subject_id, note_text, created_at "
+                "SELECT id, subject_type, subject_id, note_text, created_at, "
+                f"{_CREATED_AT_ISO} "
                 "FROM notes WHERE id = ?",
                 (note_id,),
             )
@@ -165,7 +137,8 @@ class SQLiteNoteRepository(NoteRepository):
             
             # Fetch the updated note
             cursor = await conn.execute(
-                "SELECT id, subject_type, subject_id, note_text, created_at "
+                "SELECT id, subject_type, subject_id, note_text, created_at, "
+                f"{_CREATED_AT_ISO} "
                 "FROM notes WHERE id = ?",
                 (note_id,),
             )
@@ -179,14 +152,12 @@ class SQLiteNoteRepository(NoteRepository):
                 subject_id=row["subject_id"],
                 note_text=row["note_text"],
                 created_at=datetime.fromisoformat(row["created_at"]),
+                created_at_iso=row["created_at_iso"],
             )
-        finally:
-            await conn.close()
     
     async def delete_note(self, note_id: int) -> None:
         """Delete a note by ID."""
-        conn = await self._get_connection()
-        try:
+        async with self._pool.acquire() as conn:
             cursor = await conn.execute(
                 "DELETE FROM notes WHERE id = ?",
                 (note_id,),
@@ -195,6 +166,4 @@ class SQLiteNoteRepository(NoteRepository):
             
             if cursor.rowcount == 0:
                 raise ValueError(f"Note with id {note_id} not found")
-        finally:
-            await conn.close()
 
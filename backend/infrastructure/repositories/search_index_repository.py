@@ -1,8 +1,41 @@
 """Search index repository implementation."""
-import aiosqlite
-import json
+from typing import AsyncIterator
+import numpy as np
+from infrastructure.db.connection_pool import get_pool
+from infrastructure.db.vectors import encode_vector, decode_vector
 from shared.config import settings
 
+# Millisecond timestamps, so get_version() sees every upsert
+_NOW_MS = "strftime('%Y-%m-%d %H:%M:%f', 'now')"
+
+_SNIPPET_LENGTH = 200
+
+# Display fields cut out of text_blob by SQLite, so loads never ship whole blobs:
+# the first line (which holds the name) and the head of the text for the snippet
+_SUMMARY_COLUMNS = (
+    "substr(text_blob, 1, instr(text_blob || char(10), char(10)) - 1) AS first_line, "
+    f"substr(text_blob, 1, {_SNIPPET_LENGTH}) AS snippet, "
+    f"length(text_blob) > {_SNIPPET_LENGTH} AS truncated"
+)
+
+
+def _display_name(first_line: str) -> str:
+    """Entity name from the first text line ("Name: Rick Sanchez" -> "Rick Sanchez")."""
+    if ":" in first_line:
+        return first_line.split(":", 1)[1].strip()
+    return first_line
+
+
+# Rows whose embeddings break the index invariant, moved aside by
+# quarantine_invalid_entries; created on first use, so it is not in schema.sql
+_QUARANTINE_DDL = (
+    "CREATE TABLE IF NOT EXISTS search_index_bad ("
+    "entity_type TEXT NOT NULL, entity_id TEXT NOT NULL, text_blob TEXT NOT NULL, "
+    "embedding_vector BLOB NOT NULL, updated_at TIMESTAMP, "
+    "quarantined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, "
+    "PRIMARY KEY (entity_type, entity_id))"
+)
+
 
 class SQLiteSearchIndexRepository:
     """SQLite implementation of search index repository."""
@@ -11,64 +44,143 @@ class SQLiteSearchIndexRepository:
         self.db_path = db_path or settings.database_url.replace(
             "sqlite+aiosqlite:///", ""
         )
+        self._pool = get_pool(self.db_path)
     
-    async def _get_connection(self) -> aiosqlite.Connection:
-        """Get database connection."""
-        conn = await aiosqlite.connect(self.db_path)
-        conn.row_factory = aiosqlite.Row
-        return conn
+    @staticmethod
+    def validate_embedding(vector: np.ndarray) -> None:
+        """Raise ValueError unless vector is a finite embedding of the configured size."""
+        vector = np.asarray(vector, dtype=np.float32)
+        expected = (settings.embedding_dimensions,)
+        if vector.shape != expected:
+            raise ValueError(f"Embedding has shape {vector.shape}, expected {expected}")
+        if not np.isfinite(vector).all():
+            raise ValueError("Embedding contains non-finite values")
     
     async def upsert_entry(
         self,
         entity_type: str,
         entity_id: str,
         text_blob: str,
-        embedding_vector: list[float],
+        embedding_vector: np.ndarray,
     ) -> None:
         """Upsert an entry in the search index."""
-        conn = await self._get_connection()
-        try:
-            embedding_json = json.dumps(embedding_vector)
-            await conn.execute(
-                "INSERT OR REPLACE INTO search_index "
+        await self.upsert_many([(entity_type, entity_id, text_blob, embedding_vector)])
+    
+    async def upsert_many(
+        self, entries: list[tuple[str, str, str, np.ndarray]]
+    ) -> None:
+        """Upsert (entity_type, entity_id, text_blob, embedding) entries in one transaction."""
+        if not entries:
+            return
+        # Checked here so search can treat the stored matrix as uniform and finite
+        for _, _, _, embedding in entries:
+            self.validate_embedding(embedding)
+        async with self._pool.acquire() as conn:
+            # Take the write lock up front so the batch never fails mid-way on upgrade
+            await conn.execute("BEGIN IMMEDIATE")
+            await conn.executemany(
+                "INSERT INTO search_index "
                 "(entity_type, entity_id, text_blob, embedding_vector, updated_at) "
-                "VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)",
-                (entity_type, entity_id, text_blob, embedding_json),
+                f"VALUES (?, ?, ?, ?, {_NOW_MS}) "
+                "ON CONFLICT (entity_type, entity_id) DO UPDATE SET "
+                "text_blob = excluded.text_blob, "
+                "embedding_vector = excluded.embedding_vector, "
+                "updated_at = excluded.updated_at",
+                [
+                    (entity_type, entity_id, text_blob, encode_vector(embedding))
+                    for entity_type, entity_id, text_blob, embedding in entries
+                ],
             )
             await conn.commit()
-        finally:
-            await conn.close()
     
-    async def get_all_entries(self) -> list[dict]:
-        """Get all entries from search index."""
-        conn = await self._get_connection()
-        try:
+    async def get_text_blob(self, entity_type: str, entity_id: str) -> str | None:
+        """Return the text an entry was last embedded from, if it exists."""
+        async with self._pool.acquire() as conn:
+            cursor = await conn.execute(
+                "SELECT text_blob FROM search_index "
+                "WHERE entity_type = ? AND entity_id = ?",
+                (entity_type, entity_id),
+            )
+            row = await cursor.fetchone()
+        return row["text_blob"] if row else None
+    
+    async def get_version(self) -> tuple[int, str | None]:
+        """Return a cheap token that changes whenever the index contents change."""
+        async with self._pool.acquire() as conn:
+            cursor = await conn.execute(
+                "SELECT COUNT(*), MAX(updated_at) FROM search_index"
+            )
+            count, last_updated = await cursor.fetchone()
+        return count, last_updated
+    
+    async def count_entries(self) -> int:
+        """Number of indexed entries."""
+        async with self._pool.acquire() as conn:
+            cursor = await conn.execute("SELECT COUNT(*) FROM search_index")
+            (count,) = await cursor.fetchone()
+            return count
+    
+    async def iter_entries(
+        self, batch: int = 512
+    ) -> AsyncIterator[tuple[str, str, str, str, np.ndarray]]:
+        """Stream (entity_type, entity_id, name, snippet, embedding) rows, `batch` at a time."""
+        async with self._pool.acquire() as conn:
             cursor = await conn.execute(
-                "SELECT entity_type, entity_id, text_blob, embedding_vector "
+                f"SELECT entity_type, entity_id, {_SUMMARY_COLUMNS}, embedding_vector "
                 "FROM search_index"
             )
-            rows = await cursor.fetchall()
-            return [
-                {
-                    "entity_type": row["entity_type"],
-                    "entity_id": row["entity_id"],
-                    "text_blob": row["text_blob"],
-                    "embedding_vector": json.loads(row["embedding_vector"]),
-                }
-                for row in rows
-            ]
-        finally:
-            await conn.close()
+            while rows := await cursor.fetchmany(batch):
+                for row in rows:
+                    yield (
+                        row["entity_type"],
+                        row["entity_id"],
+                        _display_name(row["first_line"]),
+                        row["snippet"] + "..." if row["truncated"] else row["snippet"],
+                        decode_vector(row["embedding_vector"]),
+                    )
+    
+    async def quarantine_invalid_entries(self) -> int:
+        """Move rows with malformed embeddings into search_index_bad. Returns how many."""
+        async with self._pool.acquire() as conn:
+            cursor = await conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_index'"
+            )
+            if await cursor.fetchone() is None:
+                # Schema not initialised yet (scripts/init_db.py); nothing to check
+                return 0
+            cursor = await conn.execute(
+                "SELECT entity_type, entity_id, embedding_vector FROM search_index"
+            )
+            bad: list[tuple[str, str]] = []
+            while rows := await cursor.fetchmany(512):
+                for row in rows:
+                    try:
+                        self.validate_embedding(decode_vector(row["embedding_vector"]))
+                    except ValueError:
+                        bad.append((row["entity_type"], row["entity_id"]))
+            if bad:
+                await conn.execute("BEGIN IMMEDIATE")
+                await conn.execute(_QUARANTINE_DDL)
+                await conn.executemany(
+                    "INSERT OR REPLACE INTO search_index_bad "
+                    "(entity_type, entity_id, text_blob, embedding_vector, updated_at) "
+                    "SELECT entity_type, entity_id, text_blob, embedding_vector, updated_at "
+                    "FROM search_index WHERE entity_type = ? AND entity_id = ?",
+                    bad,
+                )
+                await conn.executemany(
+                    "DELETE FROM search_index WHERE entity_type = ? AND entity_id = ?",
+                    bad,
+                )
+            await conn.commit()
+        return len(bad)
     
     async def delete_entry(self, entity_type: str, entity_id: str) -> None:
         """Delete an entry from search index."""
-        conn = await self._get_connection()
-        try:
+        async with self._pool.acquire() as conn:
             await conn.execute(
                 "DELETE FROM search_index WHERE entity_type = ? AND entity_id = ?",
                 (entity_type, entity_id),
             )
             await conn.commit()
-        finally:
-            await conn.close()
 
@@ -0,0 +1,199 @@
+"""FAISS-backed vector store implementation."""
+import asyncio
+import math
+import os
+from pathlib import Path
+import numpy as np
+import faiss  # type: ignore[import-untyped]
+from core.models import Character, SearchResult
+from core.ports import VectorStore
+from infrastructure.vector_store.sqlite_vector_store import SQLiteVectorStore
+from shared.config import settings
+from shared.logging import logger
+
+
+# Vectors are stored int8 scalar-quantized (4x smaller than float32); once the
+# corpus is large enough to train on, IVF-PQ compresses further (~32x at
+# M=16 for 1536-d). Candidates are re-scored against the exact float32 rows.
+_IVFPQ_MIN_VECTORS = 10_000
+_IVFPQ_M = 16
+_IVFPQ_NBITS = 8
+_IVFPQ_NPROBE = 8
+_TRAIN_SAMPLE_SIZE = 50_000
+_RERANK_FACTOR = 10
+
+# Built indexes are written to vector_index_dir, named by the SQLite
+# fingerprint they were built from. Every worker (uvicorn --workers N)
+# memory-maps the same files, so the kernel page cache holds one copy and
+# only the first worker to see a new fingerprint pays for building it.
+_INDEX_FILE = "index-{}.faiss"
+_VECTORS_FILE = "vectors-{}.npy"
+_IDS_FILE = "ids-{}.npy"  # written last; its presence marks a complete snapshot
+
+
+class FaissVectorStore(VectorStore):
+    """Vector store that persists to SQLite and searches a FAISS index shared across workers."""
+    
+    def __init__(self, db_path: str | None = None, index_dir: str | None = None):
+        self._store = SQLiteVectorStore(db_path)
+        index_dir = settings.vector_index_dir if index_dir is None else index_dir
+        self._index_dir = Path(index_dir) if index_dir else None
+        self._index: faiss.Index | None = None
+        self._characters: list[Character] = []  # FAISS row id -> character
+        self._vectors: np.ndarray | None = None  # exact unit rows for re-ranking
+        # SQLite fingerprint the loaded index was built from; checked on every
+        # search, so writes by other workers or scripts/seed_embeddings.py are seen
+        self._fingerprint: str | None = None
+        self._lock = asyncio.Lock()
+    
+    async def upsert_character(
+        self, character: Character, embedding: np.ndarray
+    ) -> None:
+        """Store character with embedding; the next search rebuilds the index."""
+        await self._store.upsert_character(character, embedding)
+    
+    def _build_index(self, embeddings: np.ndarray) -> tuple[faiss.Index, np.ndarray]:
+        """Build a quantized cosine-similarity index over the stored embeddings."""
+        xb = np.array(embeddings, dtype=np.float32, order="C")  # normalised in place
+        faiss.normalize_L2(xb)
+        n, dim = xb.shape
+        
+        if n >= _IVFPQ_MIN_VECTORS and dim % _IVFPQ_M == 0:
+            nlist = int(math.sqrt(n))
+            quantizer = faiss.IndexFlatIP(dim)
+            index = faiss.IndexIVFPQ(
+                quantizer, dim, nlist, _IVFPQ_M, _IVFPQ_NBITS, faiss.METRIC_INNER_PRODUCT
+            )
+            index.nprobe = min(nlist, _IVFPQ_NPROBE)
+        else:
+            index = faiss.IndexScalarQuantizer(
+                dim, faiss.ScalarQuantizer.QT_8bit, faiss.METRIC_INNER_PRODUCT
+            )
+        
+        if n > _TRAIN_SAMPLE_SIZE:
+            sample = np.random.default_rng(0).choice(n, _TRAIN_SAMPLE_SIZE, replace=False)
+            index.train(xb[sample])
+        else:
+            index.train(xb)
+        
+        # Sequential ids, so a hit's id is its row in the embedding matrix
+        index.add(xb)
+        logger.info(f"Built FAISS {type(index).__name__} over {n} character embeddings")
+        return index, xb
+    
+    def _load_snapshot(
+        self, fingerprint: str
+    ) -> tuple[faiss.Index, np.ndarray, np.ndarray] | None:
+        """Memory-map the snapshot built from `fingerprint`, if one exists."""
+        if self._index_dir is None:
+            return None
+        ids_path = self._index_dir / _IDS_FILE.format(fingerprint)
+        if not ids_path.exists():
+            return None
+        index_path = str(self._index_dir / _INDEX_FILE.format(fingerprint))
+        try:
+            index = faiss.read_index(index_path, faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY)
+        except RuntimeError:
+            # Index types without mmap support are read into process memory
+            index = faiss.read_index(index_path)
+        vectors = np.load(self._index_dir / _VECTORS_FILE.format(fingerprint), mmap_mode="r")
+        ids = np.load(ids_path)
+        logger.info(f"Loaded shared FAISS {type(index).__name__} snapshot {fingerprint}")
+        return index, vectors, ids
+    
+    def _save_snapshot(
+        self, fingerprint: str, index: faiss.Index, vectors: np.ndarray, ids: np.ndarray
+    ) -> None:
+        """Write a snapshot atomically and drop the ones it supersedes."""
+        if self._index_dir is None:
+            return
+        self._index_dir.mkdir(parents=True, exist_ok=True)
+        suffix = f".{os.getpid()}.tmp"
+        index_path = self._index_dir / _INDEX_FILE.format(fingerprint)
+        vectors_path = self._index_dir / _VECTORS_FILE.format(fingerprint)
+        ids_path = self._index_dir / _IDS_FILE.format(fingerprint)
+        
+        # Workers racing on the same fingerprint write identical files; last rename wins
+        faiss.write_index(index, str(index_path) + suffix)
+        os.replace(str(index_path) + suffix, index_path)
+        for path, array in ((vectors_path, vectors), (ids_path, ids)):
+            with open(str(path) + suffix, "wb") as f:
+                np.save(f, array)
+            os.replace(str(path) + suffix, path)
+        
+        current = {index_path.name, vectors_path.name, ids_path.name}
+        for stale in self._index_dir.glob("*-*.*"):
+            if stale.name not in current and not stale.name.endswith(".tmp"):
+                try:
+                    stale.unlink()  # workers still mapping it keep their pages
+                except OSError:
+                    pass
+    
+    async def _load_shared(
+        self, fingerprint: str
+    ) -> tuple[faiss.Index, list[Character], np.ndarray] | None:
+        """Load the shared snapshot for `fingerprint`, or None if it must be built."""
+        try:
+            snapshot = await asyncio.to_thread(self._load_snapshot, fingerprint)
+            if snapshot is None:
+                return None
+            index, vectors, ids = snapshot
+            by_id = await self._store.get_all_characters()
+            return index, [by_id[int(i)] for i in ids], vectors
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable FAISS snapshot {fingerprint}: {e}")
+            return None
+    
+    async def _ensure_index(self) -> None:
+        """Load the shared index snapshot, or rebuild it from SQLite, if stale."""
+        # Taken before loading, so a write during the rebuild triggers another one
+        fingerprint = await self._store.get_fingerprint()
+        if fingerprint == self._fingerprint:
+            return
+        async with self._lock:
+            if fingerprint == self._fingerprint:
+                return
+            snapshot = await self._load_shared(fingerprint)
+            if snapshot is not None:
+                index, characters, vectors = snapshot
+            else:
+                characters, embeddings = await self._store.get_all_embeddings()
+                if characters:
+                    index, vectors = await asyncio.to_thread(self._build_index, embeddings)
+                    ids = np.array([c.id for c in characters], dtype=np.int64)
+                    try:
+                        await asyncio.to_thread(self._save_snapshot, fingerprint, index, vectors, ids)
+                    except OSError as e:
+                        logger.warning(f"Could not share FAISS index via {self._index_dir}: {e}")
+                else:
+                    index, vectors = None, None
+            self._index, self._characters, self._vectors = index, characters, vectors
+            self._fingerprint = fingerprint
+    
+    async def search(
+        self, query_embedding: np.ndarray, limit: int = 10
+    ) -> list[SearchResult]:
+        """Search for similar characters by cosine similarity."""
+        await self._ensure_index()
+        index, characters, vectors = self._index, self._characters, self._vectors
+        if index is None or vectors is None:
+            logger.warning(
+                "Vector store is empty. Run scripts/seed_embeddings.py to populate."
+            )
+            return []
+        
+        query = np.array(query_embedding, dtype=np.float32).reshape(1, -1)
+        faiss.normalize_L2(query)
+        
+        # Over-fetch from the quantized index, then re-score exactly in float32
+        _, ids = index.search(query, min(limit * _RERANK_FACTOR, len(characters)))
+        candidates = ids[0][ids[0] >= 0]
+        exact = vectors[candidates] @ query[0]
+        order = np.argsort(-exact)[:limit]
+        return [
+            SearchResult(
+                character=characters[candidates[i]],
+                similarity_score=float(exact[i]),
+            )
+            for i in order
+        ]
@@ -1,10 +1,11 @@
 """SQLite-based vector store implementation."""
-import aiosqlite
 import json
 import numpy as np
 from typing import Any
 from core.models import Character, SearchResult
 from core.ports import VectorStore
+from infrastructure.db.connection_pool import get_pool
+from infrastructure.db.vectors import encode_vector, decode_vector
 from shared.config import settings
 from shared.logging import logger
 
@@ -16,36 +17,20 @@ class SQLiteVectorStore(VectorStore):
         self.db_path = db_path or settings.database_url.replace(
             "sqlite+aiosqlite:///", ""
         )
+        self._pool = get_pool(self.db_path)
     
-    async def _get_connection(self) -> aiosqlite.Connection:
-        """Get database connection."""
-        conn = await aiosqlite.connect(self.db_path)
-        conn.row_factory = aiosqlite.Row
-        return conn
-    
-    def _cosine_similarity(
-        self, vec1: list[float], vec2: list[float]
-    ) -> float:
-        """Compute cosine similarity between two vectors."""
-        vec1_arr = np.array(vec1)
-        vec2_arr = np.array(vec2)
-        
-        dot_product = np.dot(vec1_arr, vec2_arr)
-        norm1 = np.linalg.norm(vec1_arr)
-        norm2 = np.linalg.norm(vec2_arr)
-        
-        if norm1 == 0 or norm2 == 0:
-            return 0.0
-        
-        return float(dot_product / (norm1 * norm2))
+        # Corpus held as one contiguous (N, D) float32 matrix of unit rows;
+        # row i belongs to self._characters[i]. Reloaded when the stored
+        # embeddings' fingerprint changes, whichever process wrote them.
+        self._characters: list[Character] = []
+        self._matrix: np.ndarray | None = None
+        self._fingerprint: str | None = None
     
     async def upsert_character(
-        self, character: Character, embedding: list[float]
+        self, character: Character, embedding: np.ndarray
     ) -> None:
         """Store character with embedding."""
-        async with await self._get_connection() as conn:
-            # Convert embedding to JSON for storage
-            embedding_json = json.dumps(embedding)
+        async with self._pool.acquire() as conn:
             character_json = json.dumps({
                 "id": character.id,
                 "name": character.name,
@@ -65,65 +50,114 @@ class SQLiteVectorStore(VectorStore):
                 "INSERT OR REPLACE INTO character_embeddings "
                 "(character_id, character_name, character_data, embedding) "
                 "VALUES (?, ?, ?, ?)",
-                (character.id, character.name, character_json, embedding_json),
+                (character.id, character.name, character_json, encode_vector(embedding)),
             )
             await conn.commit()
     
-    async def search(
-        self, query_embedding: list[float], limit: int = 10
-    ) -> list[SearchResult]:
-        """Search for similar characters using cosine similarity."""
-        async with await self._get_connection() as conn:
+    def _row_to_character(self, row: Any) -> Character:
+        """Rebuild the stored Character from a character_embeddings row."""
+        character_data = json.loads(row["character_data"])
+        return Character(
+            id=character_data["id"],
+            name=character_data["name"],
+            status=character_data["status"],
+            species=character_data["species"],
+            type=character_data["type"],
+            gender=character_data["gender"],
+            origin=character_data["origin"],
+            location=character_data["location"],
+            image=character_data["image"],
+            episode=character_data["episode"],
+            url=character_data["url"],
+            created=character_data["created"],
+        )
+    
+    async def get_fingerprint(self) -> str:
+        """Return a token that changes whenever the stored embeddings change."""
+        async with self._pool.acquire() as conn:
+            # INSERT OR REPLACE re-inserts under a fresh AUTOINCREMENT id
+            cursor = await conn.execute(
+                "SELECT COUNT(*), COALESCE(MAX(id), 0) FROM character_embeddings"
+            )
+            count, max_id = await cursor.fetchone()
+        return f"{count}-{max_id}"
+    
+    async def get_all_characters(self) -> dict[int, Character]:
+        """Load every stored character keyed by id, without decoding embeddings."""
+        async with self._pool.acquire() as conn:
+            cursor = await conn.execute(
+                "SELECT character_id, character_data FROM character_embeddings"
+            )
+            rows = await cursor.fetchall()
+        return {row["character_id"]: self._row_to_character(row) for row in rows}
+    
+    async def get_all_embeddings(self) -> tuple[list[Character], np.ndarray]:
+        """Load every stored character with its embedding, stacked into an (N, D) matrix."""
+        async with self._pool.acquire() as conn:
             cursor = await conn.execute(
                 "SELECT character_id, character_name, character_data, embedding "
                 "FROM character_embeddings"
             )
             rows = await cursor.fetchall()
-            
-            if not rows:
+        
+        characters: list[Character] = []
+        vectors: list[np.ndarray] = []
+        for row in rows:
+            try:
+                vector = decode_vector(row["embedding"])
+                if vectors and vector.shape != vectors[0].shape:
+                    raise ValueError(f"dimension {vector.shape[0]} != {vectors[0].shape[0]}")
+                characters.append(self._row_to_character(row))
+                vectors.append(vector)
+            except Exception as e:
                 logger.warning(
-                    "Vector store is empty. Run scripts/seed_embeddings.py to populate."
+                    f"Error loading embedding for character {row['character_id']}: {e}"
                 )
-                return []
-            
-            results = []
-            for row in rows:
-                try:
-                    stored_embedding = json.loads(row["embedding"])
-                    similarity = self._cosine_similarity(
-                        query_embedding, stored_embedding
-                    )
-                    
-                    character_data = json.loads(row["character_data"])
-                    character = Character(
-                        id=character_data["id"],
-                        name=character_data["name"],
-                        status=character_data["status"],
-                        species=character_data["species"],
-                        type=character_data["type"],
-                        gender=character_data["gender"],
-                        origin=character_data["origin"],
-                        location=character_data["location"],
-                        image=character_data["image"],
-                        episode=character_data["episode"],
-                        url=character_data["url"],
-                        created=character_data["created"],
-                    )
-                    
-                    results.append(
-                        SearchResult(
-                            character=character,
-                            similarity_score=similarity,
-                        )
-                    )
-                except Exception as e:
-                    logger.warning(
-                        f"Error processing embedding for character "
-                        f"{row['character_id']}: {e}"
-                    )
-                    continue
-            
-            # Sort by similarity (descending) and return top results
-            results.sort(key=lambda x: x.similarity_score, reverse=True)
-            return results[:limit]
-
+        
+        if not vectors:
+            return [], np.empty((0, 0), dtype=np.float32)
+        return characters, np.vstack(vectors)
+    
+    async def _ensure_matrix(self) -> None:
+        """(Re)load the normalised corpus matrix if the stored embeddings have changed."""
+        # Taken before loading, so a write during the reload triggers another one
+        fingerprint = await self.get_fingerprint()
+        if fingerprint == self._fingerprint:
+            return
+        characters, matrix = await self.get_all_embeddings()
+        if matrix.size:
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            matrix = matrix / norms
+        self._characters, self._matrix = characters, matrix
+        self._fingerprint = fingerprint
+    
+    async def search(
+        self, query_embedding: np.ndarray, limit: int = 10
+    ) -> list[SearchResult]:
+        """Search for similar characters using cosine similarity."""
+        await self._ensure_matrix()
+        characters, matrix = self._characters, self._matrix
+        if not characters or matrix is None:
+            logger.warning(
+                "Vector store is empty. Run scripts/seed_embeddings.py to populate."
+            )
+            return []
+        
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query)
+        if query_norm == 0:
+            return []
+        
+        # One matrix-vector product scores the whole corpus
+        scores = matrix @ (query / query_norm)
+        if limit < len(scores):
+            # Select the top `limit` in O(N), then sort only those
+            top = np.argpartition(-scores, limit)[:limit]
+            top = top[np.argsort(-scores[top])]
+        else:
+            top = np.argsort(-scores)
+        return [
+            SearchResult(character=characters[i], similarity_score=float(scores[i]))
+            for i in top
+        ]
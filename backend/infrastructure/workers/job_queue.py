@@ -1,7 +1,6 @@
 """Background job queue for async scoring."""
 import asyncio
 from typing import Any
-from collections import deque
 from shared.logging import logger
 
 
@@ -9,22 +8,24 @@ class JobQueue:
     """In-memory job queue for background processing."""
     
     def __init__(self):
-        self.queue: deque[dict[str, Any]] = deque()
+        self.queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
         self.running = False
+        self._worker: asyncio.Task | None = None
     
     def enqueue(self, job: dict[str, Any]) -> None:
-        """Add a job to the queue."""
-        self.queue.append(job)
+        """Add a job to the queue without blocking the caller."""
+        self.queue.put_nowait(job)
         logger.info(f"Enqueued job: {job.get('type')} for {job.get('entityType')}/{job.get('entityId')}")
     
     def dequeue(self) -> dict[str, Any] | None:
         """Get next job from queue."""
-        if len(self.queue) == 0:
+        try:
+            return self.queue.get_nowait()
+        except asyncio.QueueEmpty:
             return None
-        return self.queue.popleft()
     
     def start_worker(self, process_job: callable) -> None:
-        """Start background worker that processes jobs every 200ms."""
+        """Start background worker that processes jobs as soon as they are enqueued."""
         if self.running:
             return
         
@@ -32,22 +33,23 @@ class JobQueue:
         
         async def worker_loop():
             while self.running:
-                job = self.dequeue()
-                if job:
-                    try:
-                        await process_job(job)
-                    except Exception as e:
-                        logger.error(f"Error processing job: {e}", exc_info=True)
-                
-                await asyncio.sleep(0.2)  # 200ms interval
+                # Sleeps until a job arrives instead of polling
+                job = await self.queue.get()
+                try:
+                    await process_job(job)
+                except Exception as e:
+                    logger.error(f"Error processing job: {e}", exc_info=True)
         
         # Start worker task
-        asyncio.create_task(worker_loop())
+        self._worker = asyncio.create_task(worker_loop())
         logger.info("Job queue worker started")
     
     def stop_worker(self) -> None:
         """Stop background worker."""
         self.running = False
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
         logger.info("Job queue worker stopped")
 
 
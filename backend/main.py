@@ -1,15 +1,76 @@
 """FastAPI application entry point."""
-from fastapi import FastAPI
+import os
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from api.deps import (
+    build_services,
+    create_api_client,
+    create_character_repository,
+    create_note_repository,
+    create_content_repository,
+    create_llm_provider,
+    create_evaluator,
+    create_vector_store,
+)
 from api.routers import locations, characters, episodes, generation, search
+from infrastructure.db.connection_pool import get_pool, close_pools
+from infrastructure.workers.job_queue import job_queue
 from shared.config import settings
 from shared.logging import logger
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build infrastructure singletons once at startup and tear down on shutdown."""
+    logger.info("Starting Rick & Morty AI Challenge API")
+    # Initialize database if needed
+    os.makedirs("data", exist_ok=True)
+    
+    # Open pooled SQLite connections up front so requests never pay connect cost
+    await get_pool(settings.database_path).open()
+    
+    # Pools are closed even if startup fails, so their threads don't keep the process alive
+    try:
+        app.state.api_client = create_api_client()
+        app.state.character_repo = create_character_repository()
+        app.state.note_repo = create_note_repository()
+        app.state.content_repo = create_content_repository()
+        app.state.llm_provider = create_llm_provider()
+        app.state.evaluator = create_evaluator()
+        app.state.vector_store = create_vector_store()
+        build_services(app.state)
+        await app.state.search_service.check_index()
+        
+        # Start background job queue worker
+        async def process_job(job: dict):
+            """Process a job from the queue."""
+            generation_service = app.state.generation_service
+            if job.get("type") == "FINALIZE_GENERATION":
+                await generation_service._finalize_generation_job(job)
+            elif job.get("type") == "SCORE_GENERATED_CONTENT":
+                await generation_service._score_generated_content_job(job)
+        
+        job_queue.start_worker(process_job)
+        logger.info("Background job queue worker started")
+        
+        yield
+        
+        job_queue.stop_worker()
+        app.state.generation_service.close()
+        await app.state.api_client.close()
+    finally:
+        await close_pools()
+    logger.info("Shutting down Rick & Morty AI Challenge API")
+
+
 app = FastAPI(
     title="Rick & Morty AI Challenge",
     description="AI-powered Rick & Morty data service",
     version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS
@@ -22,8 +83,6 @@ app.add_middleware(
 )
 
 # API Version 1
-from fastapi import APIRouter
-
 api_v1 = APIRouter(prefix="/v1", tags=["v1"])
 
 api_v1.include_router(locations.router)
@@ -41,30 +100,6 @@ async def health():
     return {"status": "healthy"}
 
 
-@app.on_event("startup")
-async def startup():
-    """Initialize on startup."""
-    logger.info("Starting Rick & Morty AI Challenge API")
-    # Initialize database if needed
-    import os
-    os.makedirs("data", exist_ok=True)
-    
-    # Start background job queue worker
-    from infrastructure.workers.job_queue import job_queue
-    from api.deps import get_generation_service
-    
-    async def process_job(job: dict):
-        """Process a job from the queue."""
-        generation_service = get_generation_service()
-        if job.get("type") == "FINALIZE_GENERATION":
-            await generation_service._finalize_generation_job(job)
-        elif job.get("type") == "SCORE_GENERATED_CONTENT":
-            await generation_service._score_generated_content_job(job)
-    
-    job_queue.start_worker(process_job)
-    logger.info("Background job queue worker started")
-
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -72,5 +107,6 @@ if __name__ == "__main__":
         host=settings.api_host,
         port=settings.api_port,
         reload=True,
+        loop="auto",  # uvloop when installed; requirements.txt skips it on Windows
+        http="httptools",
     )
-
@@ -9,6 +9,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from infrastructure.api.rick_and_morty_client import RickAndMortyAPIClient
 from infrastructure.llm.openai_provider import OpenAIProvider
 from infrastructure.vector_store.sqlite_vector_store import SQLiteVectorStore
+from infrastructure.db.connection_pool import close_pools
 from shared.config import settings
 from shared.logging import logger
 
@@ -65,6 +66,7 @@ async def seed_embeddings():
                 logger.error(f"Error processing character {character.id}: {e}")
     
     logger.info(f"Successfully seeded {processed} character embeddings!")
+    await close_pools()
 
 
 if __name__ == "__main__":
@@ -10,9 +10,17 @@ class Settings(BaseSettings):
     
     # Rick & Morty API
     rick_and_morty_api_url: str = "https://rickandmortyapi.com/api"
+    api_cache_size: int = 4096
+    api_cache_ttl: int = 3600  # seconds; the upstream dataset is effectively static
     
     # Database
     database_url: str = "sqlite+aiosqlite:///./data/app.db"
+    sqlite_pool_size: int = 8
+    
+    @property
+    def database_path(self) -> str:
+        """Filesystem path of the SQLite database."""
+        return self.database_url.replace("sqlite+aiosqlite:///", "")
     
     # Server
     api_host: str = "0.0.0.0"
@@ -26,7 +34,21 @@ class Settings(BaseSettings):
     
     # Vector Store
     enable_vector_store: bool = True
+    vector_store_backend: str = "faiss"  # "faiss" | "sqlite"
+    vector_index_dir: str = "./data/vector_index"  # shared by all workers; "" keeps indexes in-process
     embedding_model: str = "text-embedding-3-small"
+    embedding_dimensions: int = 1536  # vector length of embedding_model; enforced by the search index
+    query_embedding_cache_size: int = 1024
+    query_embedding_cache_ttl: int = 3600  # seconds
+    search_cache_threshold: float = 0.95  # min query cosine to reuse search results
+    search_cache_size: int = 256  # cached result lists per index version and limit
+    
+    # Generation
+    generation_cache_threshold: float = 0.95  # min cosine to reuse generated content
+    generation_cache_size: int = 1024
+    canonical_context_cache_size: int = 4096
+    canonical_context_ttl: int = 3600  # seconds
+    evaluation_workers: int = 1  # processes for heuristic scoring; 0 scores in a thread
     
     class Config:
         env_file = ".env"
@@ -64,6 +64,7 @@ API_PORT=8000
 CORS_ORIGINS=http://localhost:3000
 ENABLE_VECTOR_STORE=true
 EMBEDDING_MODEL=text-embedding-3-small
+EMBEDDING_DIMENSIONS=1536
 EOF
     echo -e "${YELLOW}⚠️  Please edit backend/.env and add your OPENAI_API_KEY${NC}"
 else